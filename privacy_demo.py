@@ -3,11 +3,104 @@
 Privacy Demo - Show exactly what gets shared vs what stays private
 """
 
+import importlib.util
+import numpy as np
 import pandas as pd
-import json
+import orjson
+import os
 import sys
 from pathlib import Path
 
+# Load the MCP server module once, straight from its file (no sys.path scan)
+_spec = importlib.util.spec_from_file_location(
+    'simple_mcp_server', Path(__file__).parent / 'src' / 'simple_mcp_server.py'
+)
+_mcp_server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mcp_server)
+safe_json_serialize = _mcp_server.safe_json_serialize
+
+from privacy_utils import find_pii, to_arrow_backed
+
+# PII that must never appear in LLM-shared output
+EMPLOYEE_PII = [
+    'Sarah Johnson', 'Michael Chen', 'Emily Rodriguez', 'David Kim', 'Jennifer Smith',
+    'sarah.johnson@company.com', 'michael.chen@company.com',
+    '123-45-6789', '234-56-7890', '345-67-8901',
+    '(555) 123-4567', '(555) 234-5678',
+    'EMP001', 'EMP002', 'MGR001'
+]
+FINANCIAL_PII = ['John Doe', 'Jane Smith', 'ACC-123456', 'ACC-234567', '15000.50', '25000.75']
+
+# Preview size for the sensitive dataset printout - only the head is formatted
+_DISPLAY_ROWS = 20
+
+# Decorative banners only when someone is watching (pass/fail lines always print): PROFESSIONAL_OUTPUT
+# (as in INTERVIEW_CONFIG) wins, otherwise an interactive non-CI terminal
+_VERBOSE = os.getenv(
+    "PROFESSIONAL_OUTPUT",
+    "true" if sys.stdout.isatty() and not os.environ.get("CI") else "false"
+).lower() == "true"
+
+# Static report blocks - precomposed so each is emitted with a single write
+_emit = sys.stdout.write
+
+_SENSITIVE_DATA_BANNER = "\n".join([
+    "\n🔴 SENSITIVE DATA (NEVER SHARED):",
+    "• Employee names, emails, phone numbers",
+    "• Social Security Numbers",
+    "• Individual salary and bonus amounts",
+    "• Manager assignments",
+    "• Personal identifiers",
+]) + "\n"
+
+_NO_PII_BANNER = "\n".join([
+    "✅ Only statistical summaries and insights shared",
+    "✅ Individual records remain completely private",
+    "✅ Business insights generated without privacy compromise",
+]) + "\n"
+
+_BUSINESS_VALUE_BANNER = "\n".join([
+    "\n🎯 BUSINESS VALUE WITH PRIVACY:",
+    "="*40,
+    "• Salary analysis without exposing individual compensation",
+    "• Department insights without revealing personal details",
+    "• Performance trends without individual ratings",
+    "• Correlation analysis with complete anonymity",
+    "• AI-powered recommendations with zero privacy risk",
+]) + "\n"
+
+_FINANCIAL_SAFE_BANNER = "\n".join([
+    "✅ No individual balances or specific amounts",
+    "✅ Only aggregated financial metrics shared",
+    "✅ GDPR/SOX compliant data handling",
+]) + "\n"
+
+_FINANCIAL_SUMMARY_TEMPLATE = "\n".join([
+    "\n📊 Safe Financial Analysis:",
+    "• Average portfolio balance: ${average_balance:,.2f}",
+    "• Average credit score: {average_credit_score:.0f}",
+    "• Account distribution: {account_types}",
+]) + "\n"
+
+_VERIFIED_BANNER = "\n".join([
+    "\n✅ Your MCP server is enterprise-ready for:",
+    "   • HR and employee data analysis",
+    "   • Financial and banking data",
+    "   • Healthcare and medical records",
+    "   • Customer PII and sensitive information",
+    "   • Any confidential business data",
+    "\n🛡️ Privacy Guarantees:",
+    "   • Raw data never leaves your machine",
+    "   • Only statistical summaries shared with AI",
+    "   • GDPR, HIPAA, SOX compliance ready",
+    "   • Zero risk of PII exposure",
+    "\n🚀 Business Benefits:",
+    "   • AI-powered insights without privacy compromise",
+    "   • Regulatory compliance maintained",
+    "   • Enterprise security standards met",
+    "   • Full data sovereignty preserved",
+]) + "\n"
+
 def create_realistic_sensitive_data():
     """Create realistic sensitive business data."""
     print("🏢 Creating realistic sensitive business dataset...")
@@ -18,15 +111,15 @@ def create_realistic_sensitive_data():
         'email': ['sarah.johnson@company.com', 'michael.chen@company.com', 'emily.rodriguez@company.com', 'david.kim@company.com', 'jennifer.smith@company.com'],
         'phone': ['(555) 123-4567', '(555) 234-5678', '(555) 345-6789', '(555) 456-7890', '(555) 567-8901'],
         'ssn': ['123-45-6789', '234-56-7890', '345-67-8901', '456-78-9012', '567-89-0123'],
-        'salary': [85000, 92000, 78000, 105000, 88000],
-        'bonus': [8500, 12000, 6500, 15000, 9200],
+        'salary': np.array([85000, 92000, 78000, 105000, 88000], dtype=np.float32),
+        'bonus': np.array([8500, 12000, 6500, 15000, 9200], dtype=np.float32),
         'department': ['Engineering', 'Engineering', 'Marketing', 'Engineering', 'Sales'],
-        'years_experience': [5, 8, 3, 12, 6],
-        'performance_rating': [4.2, 4.8, 3.9, 4.9, 4.1],
+        'years_experience': np.array([5, 8, 3, 12, 6], dtype=np.int8),
+        'performance_rating': np.array([4.2, 4.8, 3.9, 4.9, 4.1], dtype=np.float32),
         'manager_id': ['MGR001', 'MGR001', 'MGR002', 'MGR001', 'MGR003']
     }
     
-    return pd.DataFrame(data)
+    return to_arrow_backed(pd.DataFrame.from_dict(data, orient='columns'))
 
 def demonstrate_privacy_protection():
     """Show what data stays private vs what gets shared."""
@@ -38,54 +131,57 @@ def demonstrate_privacy_protection():
     
     print("📊 Original Sensitive Dataset:")
     print("="*40)
-    print(df.to_string())
-    
-    print(f"\n🔴 SENSITIVE DATA (NEVER SHARED):")
-    print("• Employee names, emails, phone numbers")
-    print("• Social Security Numbers")
-    print("• Individual salary and bonus amounts")
-    print("• Manager assignments")
-    print("• Personal identifiers")
+    print(df.head(_DISPLAY_ROWS).to_string())
     
-    # Import MCP server
-    sys.path.insert(0, '/Users/dakshinsiva/Data_MCP/src')
-    from simple_mcp_server import safe_json_serialize
+    if _VERBOSE:
+        _emit(_SENSITIVE_DATA_BANNER)
     
     # Process data (what MCP server does)
     print("\n🔄 Processing data with MCP server...")
     
+    # One aggregation pass per column and one correlation matrix for all pairs
+    stats = df[['salary', 'years_experience', 'performance_rating']].agg(
+        ['mean', 'median', 'min', 'max', 'std']
+    ).to_dict()
+    # salary, years_experience, performance_rating -> rows/cols 0, 1, 2
+    corr = np.corrcoef(
+        df[['salary', 'years_experience', 'performance_rating']].to_numpy(dtype=np.float32),
+        rowvar=False
+    )
+    department_counts = df['department'].value_counts(sort=False)
+    
     # Generate statistical summaries (what actually gets shared)
     safe_summary = {
         'dataset_overview': {
             'total_employees': len(df),
-            'departments': df['department'].value_counts().to_dict(),
-            'department_count': len(df['department'].unique())
+            'departments': department_counts.to_dict(),
+            'department_count': len(department_counts)
         },
         'salary_analysis': {
-            'average_salary': float(df['salary'].mean()),
-            'median_salary': float(df['salary'].median()),
+            'average_salary': float(stats['salary']['mean']),
+            'median_salary': float(stats['salary']['median']),
             'salary_range': {
-                'min': float(df['salary'].min()),
-                'max': float(df['salary'].max())
+                'min': float(stats['salary']['min']),
+                'max': float(stats['salary']['max'])
             },
-            'salary_std': float(df['salary'].std())
+            'salary_std': float(stats['salary']['std'])
         },
         'experience_analysis': {
-            'average_experience': float(df['years_experience'].mean()),
-            'median_experience': float(df['years_experience'].median()),
+            'average_experience': float(stats['years_experience']['mean']),
+            'median_experience': float(stats['years_experience']['median']),
             'experience_range': {
-                'min': float(df['years_experience'].min()),
-                'max': float(df['years_experience'].max())
+                'min': float(stats['years_experience']['min']),
+                'max': float(stats['years_experience']['max'])
             }
         },
         'performance_analysis': {
-            'average_rating': float(df['performance_rating'].mean()),
-            'median_rating': float(df['performance_rating'].median()),
+            'average_rating': float(stats['performance_rating']['mean']),
+            'median_rating': float(stats['performance_rating']['median']),
             'rating_distribution': 'Normal distribution observed'
         },
         'correlations': {
-            'salary_experience_correlation': float(df['salary'].corr(df['years_experience'])),
-            'performance_salary_correlation': float(df['performance_rating'].corr(df['salary']))
+            'salary_experience_correlation': float(corr[0, 1]),
+            'performance_salary_correlation': float(corr[2, 0])
         },
         'insights': [
             'Engineering department has highest average salary',
@@ -95,44 +191,30 @@ def demonstrate_privacy_protection():
         ]
     }
     
-    # Serialize safely
+    # Serialize safely - encoded once, reused for display and the PII scan
     llm_safe_output = safe_json_serialize(safe_summary)
+    output_bytes = orjson.dumps(llm_safe_output, option=orjson.OPT_INDENT_2)
     
     print("\n🟢 SAFE DATA (SHARED WITH LLM):")
     print("="*40)
-    print(json.dumps(llm_safe_output, indent=2))
+    print(output_bytes.decode())
     
     print(f"\n✅ PRIVACY PROTECTION VERIFIED:")
     print("="*40)
     
     # Verify no PII in output
-    output_str = json.dumps(llm_safe_output)
-    
-    pii_items = [
-        'Sarah Johnson', 'Michael Chen', 'Emily Rodriguez', 'David Kim', 'Jennifer Smith',
-        'sarah.johnson@company.com', 'michael.chen@company.com',
-        '123-45-6789', '234-56-7890', '345-67-8901',
-        '(555) 123-4567', '(555) 234-5678',
-        'EMP001', 'EMP002', 'MGR001'
-    ]
-    
-    pii_found = [pii for pii in pii_items if pii in output_str]
+
+    pii_found = find_pii(output_bytes, EMPLOYEE_PII)
     
     if pii_found:
         print(f"❌ PII DETECTED: {pii_found}")
     else:
         print("✅ No PII detected in LLM-shared data")
-        print("✅ Only statistical summaries and insights shared")
-        print("✅ Individual records remain completely private")
-        print("✅ Business insights generated without privacy compromise")
+        if _VERBOSE:
+            _emit(_NO_PII_BANNER)
     
-    print(f"\n🎯 BUSINESS VALUE WITH PRIVACY:")
-    print("="*40)
-    print("• Salary analysis without exposing individual compensation")
-    print("• Department insights without revealing personal details")
-    print("• Performance trends without individual ratings")
-    print("• Correlation analysis with complete anonymity")
-    print("• AI-powered recommendations with zero privacy risk")
+    if _VERBOSE:
+        _emit(_BUSINESS_VALUE_BANNER)
     
     return len(pii_found) == 0
 
@@ -145,25 +227,21 @@ def test_with_financial_data():
     financial_data = {
         'account_number': ['ACC-123456', 'ACC-234567', 'ACC-345678', 'ACC-456789', 'ACC-567890'],
         'customer_name': ['John Doe', 'Jane Smith', 'Bob Wilson', 'Alice Brown', 'Charlie Davis'],
-        'balance': [15000.50, 25000.75, 8500.25, 45000.00, 12750.80],
-        'monthly_income': [5500, 7200, 4800, 12000, 6100],
-        'credit_score': [720, 680, 650, 780, 710],
-        'loan_amount': [0, 15000, 25000, 0, 8500],
+        'balance': np.array([15000.50, 25000.75, 8500.25, 45000.00, 12750.80], dtype=np.float32),
+        'monthly_income': np.array([5500, 7200, 4800, 12000, 6100], dtype=np.float32),
+        'credit_score': np.array([720, 680, 650, 780, 710], dtype=np.int16),
+        'loan_amount': np.array([0, 15000, 25000, 0, 8500], dtype=np.float32),
         'account_type': ['Checking', 'Savings', 'Checking', 'Investment', 'Checking']
     }
     
-    df = pd.DataFrame(financial_data)
+    df = to_arrow_backed(pd.DataFrame.from_dict(financial_data, orient='columns'))
     print("🏦 Financial Dataset Created (5 customer records)")
     
-    # Process with MCP server
-    sys.path.insert(0, '/Users/dakshinsiva/Data_MCP/src')
-    from simple_mcp_server import safe_json_serialize
-    
     # Generate safe financial summary
     financial_summary = {
         'portfolio_overview': {
             'total_customers': len(df),
-            'account_types': df['account_type'].value_counts().to_dict(),
+            'account_types': df['account_type'].value_counts(sort=False).to_dict(),
             'average_balance': float(df['balance'].mean()),
             'total_portfolio_value': float(df['balance'].sum())
         },
@@ -182,25 +260,23 @@ def test_with_financial_data():
     safe_output = safe_json_serialize(financial_summary)
     
     print("\n🔒 Privacy Check:")
-    output_str = json.dumps(safe_output)
+    output_bytes = orjson.dumps(safe_output)
     
     # Check for financial PII
-    financial_pii = ['John Doe', 'Jane Smith', 'ACC-123456', 'ACC-234567', '15000.50', '25000.75']
-    pii_detected = [pii for pii in financial_pii if pii in output_str]
+    pii_detected = find_pii(output_bytes, FINANCIAL_PII)
     
     if pii_detected:
         print(f"❌ Financial PII detected: {pii_detected}")
         return False
     else:
         print("✅ No customer names or account numbers in output")
-        print("✅ No individual balances or specific amounts")
-        print("✅ Only aggregated financial metrics shared")
-        print("✅ GDPR/SOX compliant data handling")
-        
-        print(f"\n📊 Safe Financial Analysis:")
-        print(f"• Average portfolio balance: ${safe_output['portfolio_overview']['average_balance']:,.2f}")
-        print(f"• Average credit score: {safe_output['risk_analysis']['average_credit_score']:.0f}")
-        print(f"• Account distribution: {safe_output['portfolio_overview']['account_types']}")
+        if _VERBOSE:
+            _emit(_FINANCIAL_SAFE_BANNER)
+            _emit(_FINANCIAL_SUMMARY_TEMPLATE.format(
+                average_balance=safe_output['portfolio_overview']['average_balance'],
+                average_credit_score=safe_output['risk_analysis']['average_credit_score'],
+                account_types=safe_output['portfolio_overview']['account_types']
+            ))
         
         return True
 
@@ -222,24 +298,8 @@ def main():
     
     if test1_passed and test2_passed:
         print("🎉 PRIVACY FULLY VERIFIED!")
-        print("\n✅ Your MCP server is enterprise-ready for:")
-        print("   • HR and employee data analysis")
-        print("   • Financial and banking data")
-        print("   • Healthcare and medical records")
-        print("   • Customer PII and sensitive information")
-        print("   • Any confidential business data")
-        
-        print("\n🛡️ Privacy Guarantees:")
-        print("   • Raw data never leaves your machine")
-        print("   • Only statistical summaries shared with AI")
-        print("   • GDPR, HIPAA, SOX compliance ready")
-        print("   • Zero risk of PII exposure")
-        
-        print("\n🚀 Business Benefits:")
-        print("   • AI-powered insights without privacy compromise")
-        print("   • Regulatory compliance maintained")
-        print("   • Enterprise security standards met")
-        print("   • Full data sovereignty preserved")
+        if _VERBOSE:
+            _emit(_VERIFIED_BANNER)
         
     else:
         print("⚠️  Privacy issues detected - review implementation")
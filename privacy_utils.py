@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the privacy demo and verification scripts
+"""
+
+import functools
+import re
+
+# Arrow-backed columns keep strings in contiguous buffers (pyarrow is optional here)
+try:
+    import pyarrow  # noqa: F401
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+def to_arrow_backed(df):
+    """Convert to pyarrow dtypes when available, keeping the narrow numeric types."""
+    if not ARROW_AVAILABLE:
+        return df
+    return df.convert_dtypes(convert_integer=False, dtype_backend='pyarrow')
+
+# Multi-pattern PII scanner: one Aho-Corasick automaton per pattern set when
+# pyahocorasick is installed, otherwise one compiled bytes alternation
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+@functools.lru_cache(maxsize=None)
+def _pii_matcher(patterns):
+    """
+    Build (once per pattern tuple) a callable returning the patterns found in bytes output.
+
+    The Aho-Corasick automaton reports every occurrence, overlapping ones
+    included. The regex fallback is a zero-width lookahead, so it tries every
+    position but keeps only the longest item starting there; items that are
+    a prefix of that match are recovered by checking them against the
+    (few) matched strings.
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return lambda data: {hit for _, hit in automaton.iter(data.decode())}
+    # Longest items first so a short item never shadows a longer one at the same position
+    regex = re.compile(b"(?=(" + b"|".join(
+        re.escape(pattern.encode()) for pattern in sorted(patterns, key=len, reverse=True)
+    ) + b"))")
+
+    def match(data):
+        hits = {hit.decode() for hit in regex.findall(data)}
+        return {pattern for pattern in patterns if any(pattern in hit for hit in hits)}
+    return match
+
+def find_pii(output_bytes, patterns):
+    """Return the PII items present in the serialized output, in the order of ``patterns``."""
+    found = _pii_matcher(tuple(patterns))(output_bytes)
+    return [pattern for pattern in patterns if pattern in found]
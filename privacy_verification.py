@@ -4,13 +4,86 @@ Simple Privacy Verification for Data Exploration MCP Server
 Verifies that sensitive data processing happens locally and only safe summaries are generated.
 """
 
+import importlib.util
 import os
 import sys
 import pandas as pd
-import json
+import orjson
+import re
 import tempfile
 from pathlib import Path
 
+# Load the MCP server module once, straight from its file (no sys.path scan)
+try:
+    _spec = importlib.util.spec_from_file_location(
+        'simple_mcp_server', Path(__file__).parent / 'src' / 'simple_mcp_server.py'
+    )
+    _mcp_server = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_mcp_server)
+    safe_json_serialize = _mcp_server.safe_json_serialize
+    _IMPORT_ERROR = None
+except (ImportError, FileNotFoundError) as e:
+    safe_json_serialize = None
+    _IMPORT_ERROR = e
+
+from privacy_utils import find_pii, to_arrow_backed
+
+# PII that must never appear in serialized output
+PII_ITEMS = [
+    'John Smith', 'Jane Doe', 'Bob Johnson', 'Alice Brown', 'Charlie Wilson',
+    'john@email.com', 'jane@email.com', 'bob@email.com',
+    '123-45-6789', '987-65-4321', '555-12-3456',
+    '4532-1234-5678-9012', '4532-9876-5432-1098'
+]
+
+# Network-related call patterns to flag in the server source
+NETWORK_INDICATORS = [
+    'requests.', 'urllib.', 'http.client', 'socket.connect',
+    'requests.get', 'requests.post', 'urllib.request',
+    'httpx.', 'aiohttp.', '.post(', '.get('
+]
+
+# One zero-width pass reporting the longest indicator starting at each position;
+# shorter indicators shadowed at the same position are substrings of those hits
+_NETWORK_RE = re.compile("(?=(" + "|".join(
+    re.escape(indicator) for indicator in sorted(NETWORK_INDICATORS, key=len, reverse=True)
+) + "))")
+
+# Reported statistic -> describe() row
+_SUMMARY_STATS = {'mean': 'mean', 'median': '50%', 'min': 'min', 'max': 'max'}
+
+# Report blocks - precomposed so each is emitted with a single write
+_emit = sys.stdout.write
+
+_SAFE_OUTPUT_TEMPLATE = "\n".join([
+    "📊 Safe output contains:",
+    "   • Total records: {total_records}",
+    "   • Average salary: ${average_salary:,.2f}",
+    "   • Average age: {average_age:.1f}",
+    "   • Salary-age correlation: {correlation:.3f}",
+    "   • Insights: {insights}",
+]) + "\n"
+
+_VERIFIED_BANNER = "\n".join([
+    "🎉 PRIVACY VERIFIED: Your MCP server protects sensitive data! 🔒",
+    "\n✅ Key Privacy Features Confirmed:",
+    "   • Sensitive data processed locally only",
+    "   • No PII in serialized output",
+    "   • Only statistical summaries generated",
+    "   • No network calls in analysis code",
+    "   • File system isolation maintained",
+    "\n🛡️ Your data is safe to analyze with AI-augmented insights!",
+]) + "\n"
+
+_REVIEW_BANNER = "\n".join([
+    "⚠️  PRIVACY REVIEW NEEDED: Some tests failed",
+    "\n📋 Recommendations:",
+    "   • Review failed tests above",
+    "   • Ensure MCP server processes data locally only",
+    "   • Verify no PII in LLM communications",
+    "   • Test with your actual sensitive data",
+]) + "\n"
+
 def test_data_privacy():
     """Test that sensitive data is processed locally and only safe summaries are created."""
     print("🔒 PRIVACY VERIFICATION TEST")
@@ -28,41 +101,31 @@ def test_data_privacy():
         'account_balance': [15000, 25000, 8000, 35000, 12000]
     }
     
-    df = pd.DataFrame(sensitive_data)
+    df = to_arrow_backed(pd.DataFrame(sensitive_data))
     print(f"✅ Created dataset with {len(df)} records containing PII")
     
     # Test 1: Local Processing
     print("\n📋 Test 1: Local Data Processing")
     
-    # Import MCP server functions
-    sys.path.insert(0, '/Users/dakshinsiva/Data_MCP/src')
-    try:
-        from simple_mcp_server import safe_json_serialize
-        print("✅ MCP server modules imported successfully")
-    except ImportError as e:
-        print(f"❌ Failed to import MCP server: {e}")
+    # Check MCP server functions
+    if _IMPORT_ERROR is not None:
+        print(f"❌ Failed to import MCP server: {_IMPORT_ERROR}")
         return False
+    print("✅ MCP server modules imported successfully")
     
     # Process data locally (simulate MCP server analysis)
     print("🔄 Processing sensitive data locally...")
     
     numeric_cols = df.select_dtypes(include=['number']).columns
+    # One describe() pass for all summary statistics, one corr() for the pair
+    salary_age = df[['salary', 'age']]
+    desc = salary_age.describe().to_dict()
     analysis_result = {
         'total_records': len(df),
         'numeric_columns': len(numeric_cols),
-        'salary_stats': {
-            'mean': float(df['salary'].mean()),
-            'median': float(df['salary'].median()),
-            'min': float(df['salary'].min()),
-            'max': float(df['salary'].max())
-        },
-        'age_stats': {
-            'mean': float(df['age'].mean()),
-            'median': float(df['age'].median()),
-            'min': float(df['age'].min()),
-            'max': float(df['age'].max())
-        },
-        'correlation_salary_age': float(df['salary'].corr(df['age'])),
+        'salary_stats': {stat: float(desc['salary'][key]) for stat, key in _SUMMARY_STATS.items()},
+        'age_stats': {stat: float(desc['age'][key]) for stat, key in _SUMMARY_STATS.items()},
+        'correlation_salary_age': float(salary_age.corr().iat[0, 1]),
         'insights': 'Statistical analysis complete - correlations and distributions analyzed'
     }
     
@@ -73,21 +136,10 @@ def test_data_privacy():
     # Test 2: PII Detection
     print("\n📋 Test 2: PII Leakage Detection")
     
-    output_json = json.dumps(safe_output)
-    
-    # Check for PII in output
-    pii_items = [
-        'John Smith', 'Jane Doe', 'Bob Johnson', 'Alice Brown', 'Charlie Wilson',
-        'john@email.com', 'jane@email.com', 'bob@email.com',
-        '123-45-6789', '987-65-4321', '555-12-3456',
-        '4532-1234-5678-9012', '4532-9876-5432-1098'
-    ]
-    
-    pii_found = []
-    for pii in pii_items:
-        if pii in output_json:
-            pii_found.append(pii)
+    output_bytes = orjson.dumps(safe_output)
     
+    # Check for PII in output - one multi-pattern pass over the serialized bytes
+    pii_found = find_pii(output_bytes, PII_ITEMS)
     if pii_found:
         print(f"❌ PII DETECTED in output: {pii_found}")
         return False
@@ -97,16 +149,17 @@ def test_data_privacy():
     # Test 3: Statistical Data Verification
     print("\n📋 Test 3: Statistical Data Only")
     
-    print("📊 Safe output contains:")
-    print(f"   • Total records: {safe_output['total_records']}")
-    print(f"   • Average salary: ${safe_output['salary_stats']['mean']:,.2f}")
-    print(f"   • Average age: {safe_output['age_stats']['mean']:.1f}")
-    print(f"   • Salary-age correlation: {safe_output['correlation_salary_age']:.3f}")
-    print(f"   • Insights: {safe_output['insights']}")
+    _emit(_SAFE_OUTPUT_TEMPLATE.format(
+        total_records=safe_output['total_records'],
+        average_salary=safe_output['salary_stats']['mean'],
+        average_age=safe_output['age_stats']['mean'],
+        correlation=safe_output['correlation_salary_age'],
+        insights=safe_output['insights']
+    ))
     
     # Verify only statistical summaries
     safe_keys = ['total_records', 'mean', 'median', 'min', 'max', 'correlation', 'insights']
-    has_safe_data = any(key in output_json for key in safe_keys)
+    has_safe_data = any(key.encode() in output_bytes for key in safe_keys)
     
     if has_safe_data:
         print("✅ Output contains only statistical summaries")
@@ -135,22 +188,17 @@ def test_network_isolation():
     
     try:
         # Read MCP server source code
-        server_file = Path('/Users/dakshinsiva/Data_MCP/src/simple_mcp_server.py')
+        server_file = Path(__file__).parent / 'src' / 'simple_mcp_server.py'
         if server_file.exists():
             content = server_file.read_text()
             
             # Check for network-related imports or calls
-            network_indicators = [
-                'requests.', 'urllib.', 'http.client', 'socket.connect',
-                'requests.get', 'requests.post', 'urllib.request',
-                'httpx.', 'aiohttp.', '.post(', '.get('
+            hits = set(_NETWORK_RE.findall(content))
+            network_found = [
+                indicator for indicator in NETWORK_INDICATORS
+                if any(indicator in hit for hit in hits)
             ]
             
-            network_found = []
-            for indicator in network_indicators:
-                if indicator in content:
-                    network_found.append(indicator)
-            
             if network_found:
                 print(f"⚠️  Potential network calls found: {network_found}")
                 print("   (These might be false positives - manual review recommended)")
@@ -201,23 +249,9 @@ def main():
     print(f"🎯 Tests Passed: {tests_passed}/{total_tests}")
     
     if tests_passed == total_tests:
-        print("🎉 PRIVACY VERIFIED: Your MCP server protects sensitive data! 🔒")
-        print("\n✅ Key Privacy Features Confirmed:")
-        print("   • Sensitive data processed locally only")
-        print("   • No PII in serialized output")
-        print("   • Only statistical summaries generated")
-        print("   • No network calls in analysis code")
-        print("   • File system isolation maintained")
-        
-        print("\n🛡️ Your data is safe to analyze with AI-augmented insights!")
-        
+        _emit(_VERIFIED_BANNER)
     else:
-        print("⚠️  PRIVACY REVIEW NEEDED: Some tests failed")
-        print("\n📋 Recommendations:")
-        print("   • Review failed tests above")
-        print("   • Ensure MCP server processes data locally only")
-        print("   • Verify no PII in LLM communications")
-        print("   • Test with your actual sensitive data")
+        _emit(_REVIEW_BANNER)
     
     return tests_passed == total_tests
 
@@ -7,16 +7,15 @@ during technical interviews. Designed to handle unknown datasets with
 professional-grade analysis and real-time collaboration.
 """
 
-import asyncio
 import logging
 import os
 import sys
+from importlib import metadata
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from mcp.server.fastmcp import FastMCP
-from mcp.server.session import ServerSession
-from mcp.types import Resource, Tool
+# Heavy dependencies (pandas, the MCP server) are imported inside the commands
+# that need them, so --help and version start without loading them
 import typer
 
 # Add project root to path for imports
@@ -58,6 +57,44 @@ INTERVIEW_CONFIG = {
 
 # MCP server initialization is handled in simple_mcp_server.py
 
+def fast_memory_mb(df) -> float:
+    """
+    Memory footprint of a DataFrame in MB.
+    
+    The per-value string walk of ``deep=True`` is only needed while text
+    columns remain; numeric and category frames are measured from their
+    buffers (codes + categories) in O(ncols).
+    """
+    deep = not df.select_dtypes(include=['object', 'string']).columns.empty
+    return df.memory_usage(index=True, deep=deep).sum() / (1024*1024)
+
+def read_csv_fast(file_path: str):
+    """
+    Read a CSV with pandas' multithreaded pyarrow engine, falling back to the C parser.
+    
+    Columns pyarrow types as dates or timestamps are re-read as text by the
+    C parser, so both engines report the same dtypes and memory.
+    """
+    from datetime import date
+    import pandas as pd
+    try:
+        data = pd.read_csv(file_path, engine='pyarrow')
+    except Exception as e:  # pyarrow missing or an input it cannot parse
+        logger.debug(f"pyarrow CSV engine failed for {file_path}, using C parser: {e}")
+        return pd.read_csv(file_path)
+    
+    date_cols = []
+    for col in data.columns:
+        series = data[col]
+        first = series.first_valid_index() if series.dtype == object else None
+        if series.dtype.kind == 'M' or (first is not None and isinstance(series.at[first], date)):
+            date_cols.append(col)
+    if date_cols:
+        text = pd.read_csv(file_path, usecols=date_cols)
+        for col in date_cols:
+            data[col] = text[col]
+    return data
+
 @app.command()
 def serve(
     host: str = typer.Option("localhost", help="Host to bind the server to"),
@@ -88,8 +125,8 @@ def serve(
     
     # Start the simple MCP server
     try:
-        from src.simple_mcp_server import main as mcp_main
-        asyncio.run(mcp_main())
+        from src.simple_mcp_server import run_server
+        run_server()
     except KeyboardInterrupt:
         logger.info("🛑 Server stopped by user")
     except Exception as e:
@@ -110,8 +147,7 @@ def analyze(
     logger.info(f"🔍 Quick analysis of: {file_path}")
     
     try:
-        import pandas as pd
-        data = pd.read_csv(file_path)
+        data = read_csv_fast(file_path)
         
         typer.echo(f"📊 Dataset: {len(data):,} rows × {len(data.columns)} columns")
         typer.echo(f"💾 Memory usage: {data.memory_usage(deep=True).sum() / (1024*1024):.2f} MB")
@@ -134,19 +170,17 @@ def test_optimization(
         raise typer.Exit(1)
         
     try:
-        import pandas as pd
-        data = pd.read_csv(file_path)
-        original_memory = data.memory_usage(deep=True).sum() / (1024*1024)
+        data = read_csv_fast(file_path)
+        original_memory = fast_memory_mb(data)
         
-        # Simple optimization
-        optimized_data = data.copy()
-        for col in optimized_data.columns:
-            if optimized_data[col].dtype == 'object':
-                unique_ratio = optimized_data[col].nunique() / len(optimized_data)
-                if unique_ratio < 0.5:
-                    optimized_data[col] = optimized_data[col].astype('category')
+        # Simple optimization - low-cardinality text columns to category
+        # (one astype pass instead of copying the whole frame up front)
+        object_cols = data.select_dtypes(include='object').columns
+        unique_ratios = data[object_cols].nunique() / len(data)
+        category_map = {col: 'category' for col in object_cols[unique_ratios < 0.5]}
+        optimized_data = data.astype(category_map)
         
-        optimized_memory = optimized_data.memory_usage(deep=True).sum() / (1024*1024)
+        optimized_memory = fast_memory_mb(optimized_data)
         reduction = ((original_memory - optimized_memory) / original_memory) * 100
         
         typer.echo(f"🧠 Memory Optimization Results:")
@@ -162,9 +196,13 @@ def test_optimization(
 @app.command()
 def version() -> None:
     """Show version information."""
-    from src import __version__, __author__, __description__
+    try:
+        package_version = metadata.version("data-exploration-mcp")
+    except metadata.PackageNotFoundError:
+        from src import __version__ as package_version
+    from src import __author__, __description__
     
-    typer.echo(f"Veeam Interview Analyzer v{__version__}")
+    typer.echo(f"Veeam Interview Analyzer v{package_version}")
     typer.echo(f"Author: {__author__}")
     typer.echo(f"Description: {__description__}")
 
@@ -174,8 +212,8 @@ def main() -> None:
     if len(sys.argv) == 1 or (len(sys.argv) == 2 and sys.argv[1] in ["-m", "--mcp"]):
         logger.info("🚀 Starting in MCP server mode")
         # Use the simple MCP server
-        from src.simple_mcp_server import main as mcp_main
-        asyncio.run(mcp_main())
+        from src.simple_mcp_server import run_server
+        run_server()
     else:
         # Handle CLI commands
         app()
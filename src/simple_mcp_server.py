@@ -5,66 +5,532 @@ Minimal implementation focusing on core functionality.
 """
 
 import asyncio
+import copy
+import functools
+import hashlib
+import importlib.util
 import json
 import logging
+import os
+import pickle
+import re
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import pandas as pd
 import numpy as np
-from pathlib import Path
+from pandas.api.types import union_categoricals
+
+# pyarrow's multithreaded CSV and JSON-lines parsers and memory-mapped Parquet reader
+# are used when available
+try:
+    import pyarrow as pa
+    import pyarrow.json as pa_json
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# C-extension JSON encoder for tool responses (native NumPy scalars and arrays)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# JIT-compiled kernels for large frames (performance extra). numba takes longer to
+# import than the rest of the server, so only its presence is checked here; it is
+# imported by _jit when the first frame large enough to need a kernel arrives
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+@functools.cache
+def _jit(kernel):
+    """
+    The numba-compiled version of a kernel function, built on first use.
+    
+    Compiled serial: tools run on worker threads, and numba's parallel
+    threading layers are not safe to enter from several threads at once
+    (workqueue aborts the process). The kernels loop over at most a few
+    dozen columns, so the fused single pass is where the win is. No on-disk
+    cache: numba keys it by source file, and this file is also loaded under
+    other module names (the privacy scripts load it from its path), which
+    makes a cached kernel fail to load under the other name.
+    """
+    from numba import njit
+    return njit(kernel)
+
+# Statistical tests, ranks and t-distribution tails - imported once here so the
+# first handler call does not pay scipy's import cost
+try:
+    from scipy import special as _special, stats as _stats
+except ImportError:
+    _special = _stats = None
+
+# Upper-triangle-only Gram product (BLAS SYRK) for correlation matrices
+try:
+    from scipy.linalg.blas import dsyrk, ssyrk
+    SCIPY_BLAS_AVAILABLE = True
+except ImportError:
+    SCIPY_BLAS_AVAILABLE = False
+
+# SIMD-accelerated content hashing for the whole-report result cache
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# libuv-backed event loop for the stdio server when installed (performance extra)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Rust-based Excel reader behind pandas' engine='calamine' (performance extra); pandas
+# imports it itself, so only its presence is checked here. The engine arrived in
+# pandas 2.2 - older releases keep openpyxl/xlrd.
+CALAMINE_AVAILABLE = (
+    importlib.util.find_spec("python_calamine") is not None
+    and tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+)
 
 from mcp.server.stdio import stdio_server
 from mcp.server import Server, InitializationOptions
 from mcp.types import TextContent, Tool
 
-def load_data_file(file_path: str) -> pd.DataFrame:
+# Parsed datasets keyed by (path, mtime_ns, size) - every tool re-reads the same file,
+# so repeat calls skip parsing until the file changes on disk
+_DATA_CACHE: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_DATA_CACHE_SIZE = 8
+_DATA_CACHE_LOCK = threading.Lock()  # tools run on worker threads
+
+# Column profiles for the same file versions (see dataset_summary)
+_SUMMARY_CACHE: "OrderedDict[tuple, DatasetSummary]" = OrderedDict()
+
+# Opt-in numeric downcasting at load time (narrower dtypes for every later reduction,
+# at the cost of float32 precision in reported statistics)
+DOWNCAST_ON_LOAD = os.getenv("DOWNCAST_ON_LOAD", "false").lower() == "true"
+
+# Opt-in chunked parsing for delimited files at least this many MB (0 = off): chunks of
+# CHUNKED_LOAD_ROWS rows are parsed one at a time and low-cardinality text columns are
+# stored as categories, bounding peak memory near the optimized frame's size
+CHUNKED_LOAD_MB = float(os.getenv("CHUNKED_LOAD_MB", "0"))
+CHUNKED_LOAD_ROWS = 200_000
+
+# Opt-in Parquet sidecar cache (needs pyarrow): after a non-Parquet file is parsed, a
+# ZSTD/dictionary-encoded copy is written next to it as <file>.mcp.parquet in the
+# background, and later loads of the same file version read the sidecar instead
+PARQUET_SIDECAR = os.getenv("PARQUET_SIDECAR", "false").lower() == "true"
+_SIDECAR_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parquet-sidecar")
+
+# Integer targets tried from narrowest to widest
+_INT_TARGETS = ('int8', 'int16', 'int32')
+_FLOAT32_ATOL = 5e-4  # pandas' own float64 -> float32 downcast tolerance
+
+def downcast_numeric(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink integer columns to the smallest integer type and float columns to float32 where they fit.
+    
+    Integer ranges come from one frame-wide min/max sweep; float columns are
+    narrowed as a block and kept as float32 only where every value survives
+    within pandas' downcast tolerance. All conversions are applied in one astype.
+    """
+    dtype_map = {}
+    
+    int_data = data.select_dtypes(include=['integer'])
+    if len(int_data.columns):
+        c_min, c_max = int_data.min().to_numpy(), int_data.max().to_numpy()
+        itemsizes = np.array([dtype.itemsize for dtype in int_data.dtypes])
+        targets = np.select(
+            [(c_min >= np.iinfo(t).min) & (c_max <= np.iinfo(t).max) & (np.dtype(t).itemsize < itemsizes)
+             for t in _INT_TARGETS],
+            _INT_TARGETS,
+            default=''
+        )
+        dtype_map.update({col: target for col, target in zip(int_data.columns, targets) if target})
+    
+    float_data = data.select_dtypes(include=['float64'])
+    if len(float_data.columns):
+        values = float_data.to_numpy()
+        with np.errstate(over='ignore'):  # out-of-range values become inf and fail the check
+            narrowed = values.astype(np.float32)
+        fits = np.isclose(narrowed, values, rtol=0.0, atol=_FLOAT32_ATOL, equal_nan=True).all(axis=0)
+        dtype_map.update(dict.fromkeys(float_data.columns[fits], 'float32'))
+    
+    return data.astype(dtype_map) if dtype_map else data
+
+def _is_low_cardinality(series: pd.Series, frac: float = 0.5, sample: int = 10_000) -> bool:
+    """
+    True when fewer than ``frac`` of the values are distinct.
+    
+    Long columns are first checked on their leading ``sample`` rows: if those
+    are already mostly distinct (IDs, free text) the full scan is skipped.
+    """
+    n_rows = len(series)
+    if n_rows > sample and series.head(sample).nunique() > frac * sample:
+        return False
+    return series.nunique() < frac * n_rows
+
+def category_candidates(frame: pd.DataFrame, frac: float = 0.5) -> list:
+    """Text columns of ``frame`` worth storing as category (fewer than ``frac`` distinct values)."""
+    return [
+        col for col in frame.select_dtypes(include=['object']).columns
+        if _is_low_cardinality(frame[col], frac)
+    ]
+
+def looks_like_dates(series: pd.Series, sample: int = 20, min_share: float = 0.8) -> bool:
+    """
+    True for datetime columns and text columns whose leading values mostly parse as dates.
+    
+    Numeric and boolean columns are rejected by dtype - to_datetime would
+    otherwise accept them as epoch offsets. Text is probed on a small sample
+    with errors='coerce', so no exception is raised per column.
+    """
+    if series.dtype.kind == 'M':
+        return True
+    if series.dtype.kind in 'iufcb':
+        return False
+    probe = series.dropna().head(sample)
+    if probe.empty:
+        return False
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)  # per-element format inference notice
+        parsed = pd.to_datetime(probe, errors='coerce')
+    return parsed.notna().mean() > min_share
+
+# Stats already taken for the running request, by path. A multi-tool report stats its
+# file once and every sub-tool (tasks and worker threads inherit the context) reuses it
+_REQUEST_STATS: ContextVar[Optional[Dict[str, os.stat_result]]] = ContextVar('_REQUEST_STATS', default=None)
+
+def _require_file(file_path: str) -> Optional[os.stat_result]:
+    """Stat a dataset path once; None when it does not exist (the stat also keys the cache)."""
+    known = _REQUEST_STATS.get()
+    if known is not None and file_path in known:
+        return known[file_path]
+    try:
+        return os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+def load_data_file(file_path: str, usecols=None, stat: Optional[os.stat_result] = None) -> pd.DataFrame:
     """
     Smart data loading function that supports multiple file formats.
     Supports: CSV, Excel (.xlsx, .xls), TSV, JSON, Parquet
+    
+    Results are cached per file version; callers get a shallow copy so
+    column assignments never leak back into the cache. When ``usecols`` is
+    given only those columns (the ones present in the file) are returned,
+    and delimited files parse just those columns. Pass the ``stat`` from
+    ``_require_file`` to skip a second stat call.
+    """
+    if stat is None:
+        stat = os.stat(file_path)
+    key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+    
+    with _DATA_CACHE_LOCK:
+        if usecols is not None:
+            full = _DATA_CACHE.get(key)
+            if full is not None:
+                # Already parsed in full - slice instead of re-reading
+                _DATA_CACHE.move_to_end(key)
+                wanted = set(usecols)
+                return full[[col for col in full.columns if col in wanted]]
+            key = key + (tuple(usecols),)
+        
+        cached = _DATA_CACHE.get(key)
+        if cached is not None:
+            _DATA_CACHE.move_to_end(key)
+            return cached.copy(deep=False)
+    
+    # Parse outside the lock so other tools are not blocked behind a large file
+    use_sidecar = PARQUET_SIDECAR and PYARROW_AVAILABLE and Path(file_path).suffix.lower() != '.parquet'
+    cached = _read_sidecar(file_path, stat, usecols) if use_sidecar else None
+    if cached is None:
+        cached = _read_data_file(file_path, usecols)
+        if use_sidecar and usecols is None:
+            _SIDECAR_WRITER.submit(_write_sidecar, file_path, stat, cached)
+    if DOWNCAST_ON_LOAD:
+        cached = downcast_numeric(cached)
+    
+    with _DATA_CACHE_LOCK:
+        _DATA_CACHE[key] = cached
+        if len(_DATA_CACHE) > _DATA_CACHE_SIZE:
+            _DATA_CACHE.popitem(last=False)
+    
+    return cached.copy(deep=False)
+
+@dataclass
+class DatasetSummary:
+    """
+    Column profile of one loaded file version, shared by every handler that loads it.
+    
+    Column groups come straight from the dtypes. Null and distinct counts are
+    full passes over the data, so each is computed on first access and kept.
+    """
+    n_rows: int
+    dtypes: pd.Series
+    numeric_cols: list
+    object_cols: list
+    category_cols: list
+    data: pd.DataFrame = field(repr=False)
+    
+    @functools.cached_property
+    def nulls(self) -> pd.Series:
+        return self.data.isnull().sum()
+    
+    @functools.cached_property
+    def nunique(self) -> pd.Series:
+        return self.data.nunique()
+    
+    @property
+    def completeness(self) -> float:
+        """Share of non-missing cells."""
+        return 1 - self.nulls.sum() / (self.n_rows * len(self.dtypes))
+
+def dataset_summary(file_path: str, stat: Optional[os.stat_result] = None) -> DatasetSummary:
+    """Cached DatasetSummary for the file version load_data_file would return."""
+    if stat is None:
+        stat = os.stat(file_path)
+    key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+    
+    with _DATA_CACHE_LOCK:
+        summary = _SUMMARY_CACHE.get(key)
+        if summary is not None:
+            _SUMMARY_CACHE.move_to_end(key)
+            return summary
+    
+    data = load_data_file(file_path, stat=stat)
+    summary = DatasetSummary(
+        n_rows=len(data),
+        dtypes=data.dtypes,
+        numeric_cols=data.select_dtypes(include=['number']).columns.tolist(),
+        object_cols=data.select_dtypes(include=['object']).columns.tolist(),
+        category_cols=data.select_dtypes(include=['category']).columns.tolist(),
+        data=data
+    )
+    
+    with _DATA_CACHE_LOCK:
+        _SUMMARY_CACHE[key] = summary
+        if len(_SUMMARY_CACHE) > _DATA_CACHE_SIZE:
+            _SUMMARY_CACHE.popitem(last=False)
+    
+    return summary
+
+def _arrow_typed_dates(data: pd.DataFrame) -> list:
+    """Columns the pyarrow CSV engine typed as dates (datetime.date objects) or timestamps."""
+    date_cols = []
+    for col in data.columns:
+        series = data[col]
+        if series.dtype.kind == 'M':
+            date_cols.append(col)
+        elif series.dtype == object:
+            first = series.first_valid_index()
+            if first is not None and isinstance(series.at[first], date):
+                date_cols.append(col)
+    return date_cols
+
+def _read_csv(file_path, usecols=None, **kwargs) -> pd.DataFrame:
     """
+    Read a delimited file with the pyarrow engine, falling back to the C parser.
+    
+    pyarrow types date and timestamp text on its own, which the C parser
+    leaves as strings; those columns are re-read as text by the C parser,
+    so the dtype-based column selection used throughout the handlers (and
+    the reported dtypes and memory) is the same with either engine.
+    ``usecols`` names missing from the file are ignored; the rest are resolved
+    against the header into a plain list, which both engines accept.
+    """
+    if usecols is not None:
+        wanted = set(usecols)
+        header = pd.read_csv(file_path, nrows=0, **kwargs).columns
+        kwargs['usecols'] = [col for col in header if col in wanted]
+    if CHUNKED_LOAD_MB and os.path.getsize(file_path) >= CHUNKED_LOAD_MB * 1024 * 1024:
+        return _read_csv_chunked(file_path, **kwargs)
+    if PYARROW_AVAILABLE:
+        try:
+            data = pd.read_csv(file_path, engine='pyarrow', **kwargs)
+        except Exception as e:
+            logger.debug(f"pyarrow CSV engine failed for {file_path}, using C parser: {e}")
+        else:
+            date_cols = _arrow_typed_dates(data)
+            if date_cols:
+                text = pd.read_csv(file_path, **{**kwargs, 'usecols': date_cols})
+                for col in date_cols:
+                    data[col] = text[col]
+            return data
+    return pd.read_csv(file_path, **kwargs)
+
+def _is_json_lines(file_path) -> bool:
+    """True when the file starts with two one-line JSON objects (newline-delimited records)."""
+    with open(file_path, 'rb') as f:
+        head = f.read(1 << 16).lstrip()
+    lines = head.split(b'\n', 2)
+    if len(lines) < 2:
+        return False
+    first, second = lines[0].strip(), lines[1].strip()
+    return first.startswith(b'{') and first.endswith(b'}') and second.startswith(b'{')
+
+def _read_json(file_path) -> pd.DataFrame:
+    """
+    Read newline-delimited JSON with pyarrow's multithreaded block parser.
+    
+    Other JSON layouts (a top-level array, or one column-oriented object) are
+    read with pd.read_json as before - a one-line object would otherwise be
+    taken by pyarrow as a single record. Without pyarrow, JSON lines are read
+    by pandas in lines mode.
+    """
+    lines = _is_json_lines(file_path)
+    if PYARROW_AVAILABLE and lines:
+        try:
+            table = pa_json.read_json(
+                file_path, read_options=pa_json.ReadOptions(use_threads=True, block_size=64 << 20)
+            )
+            return table.to_pandas(self_destruct=True, split_blocks=True)
+        except pa.ArrowInvalid as e:
+            logger.debug(f"pyarrow JSON reader failed for {file_path}, using pandas: {e}")
+    return pd.read_json(file_path, lines=lines)
+
+def _read_parquet(file_path, usecols=None) -> pd.DataFrame:
+    """
+    Read a Parquet file through a memory map, decoding only the requested columns.
+    
+    Pages are faulted in from the page cache instead of copied into a read
+    buffer, and self_destruct/split_blocks release each Arrow column as soon
+    as it has been converted, so peak memory stays near one copy of the data.
+    Columns keep the default NumPy dtypes, as with the CSV readers.
+    """
+    columns = None
+    if usecols is not None:
+        wanted = set(usecols)
+        columns = [col for col in pq.read_schema(file_path).names if col in wanted]
+    table = pq.read_table(file_path, columns=columns, memory_map=True, use_threads=True, use_pandas_metadata=True)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+def _sidecar_path(file_path) -> Path:
+    return Path(f"{file_path}.mcp.parquet")
+
+def _sidecar_tag(stat: os.stat_result) -> bytes:
+    """Source file version recorded in (and checked against) the sidecar's schema metadata."""
+    return f"{stat.st_mtime_ns}:{stat.st_size}".encode()
+
+def _read_sidecar(file_path, stat: os.stat_result, usecols=None) -> Optional[pd.DataFrame]:
+    """The Parquet sidecar of this exact file version (only ``usecols`` decoded), or None."""
+    sidecar = _sidecar_path(file_path)
+    try:
+        metadata = pq.read_schema(sidecar).metadata or {}
+    except (OSError, pa.ArrowException):  # missing or unreadable
+        return None
+    if metadata.get(b'mcp_source') != _sidecar_tag(stat):
+        return None
+    return _read_parquet(sidecar, usecols)
+
+def _write_sidecar(file_path, stat: os.stat_result, data: pd.DataFrame) -> None:
+    """Write the parsed frame as <file>.mcp.parquet (ZSTD, dictionary-encoded), atomically."""
+    sidecar = _sidecar_path(file_path)
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b'mcp_source': _sidecar_tag(stat)})
+        pq.write_table(
+            table, tmp_path, compression='zstd', compression_level=3, use_dictionary=True,
+            data_page_size=1 << 20, write_statistics=True
+        )
+        os.replace(tmp_path, sidecar)
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.debug(f"Could not write Parquet sidecar for {file_path}: {e}")
+
+def _read_csv_chunked(file_path, chunksize: int = CHUNKED_LOAD_ROWS, **kwargs) -> pd.DataFrame:
+    """
+    Parse a delimited file chunk by chunk, keeping low-cardinality text as categories.
+    
+    Category candidates are chosen on the leading ``chunksize`` rows, and the
+    candidates are then read as text in every chunk - a chunk where such a
+    column is empty or looks boolean would otherwise infer its own dtype,
+    and union_categoricals rejects categories of mixed dtypes. Each chunk
+    converts them on arrival so only compact codes accumulate, and the
+    per-chunk categoricals are merged with union_categoricals at the end.
+    """
+    category_cols = category_candidates(pd.read_csv(file_path, nrows=chunksize, **kwargs))
+    if category_cols:
+        kwargs['dtype'] = {**kwargs.get('dtype', {}), **dict.fromkeys(category_cols, str)}
+    
+    chunks = []
+    for chunk in pd.read_csv(file_path, chunksize=chunksize, **kwargs):
+        if category_cols:
+            chunk = chunk.astype(dict.fromkeys(category_cols, 'category'))
+        chunks.append(chunk)
+    
+    if not chunks:  # header only
+        return pd.read_csv(file_path, **kwargs)
+    if len(chunks) == 1:
+        return chunks[0]
+    
+    return pd.DataFrame({
+        col: (
+            union_categoricals([chunk[col] for chunk in chunks])
+            if col in category_cols else
+            pd.concat([chunk[col] for chunk in chunks], ignore_index=True)
+        )
+        for col in chunks[0].columns
+    })
+
+def _read_data_file(file_path: str, usecols=None) -> pd.DataFrame:
+    """Parse a data file from disk, dispatching on its extension."""
     file_path = Path(file_path)
     file_ext = file_path.suffix.lower()
     
     try:
         if file_ext == '.csv':
-            return pd.read_csv(file_path)
+            return _read_csv(file_path, usecols)
         elif file_ext in ['.xlsx', '.xls']:
             # Try to read Excel file, handle multiple sheets
             try:
-                return pd.read_excel(file_path, engine='openpyxl' if file_ext == '.xlsx' else 'xlrd')
+                data = None
+                if CALAMINE_AVAILABLE:
+                    try:
+                        data = pd.read_excel(file_path, engine='calamine')
+                    except ValueError as e:  # engine unknown to this pandas build
+                        logger.debug(f"calamine engine unavailable for {file_path}, using openpyxl/xlrd: {e}")
+                if data is None:
+                    data = pd.read_excel(file_path, engine='openpyxl' if file_ext == '.xlsx' else 'xlrd')
             except ImportError:
                 logger.warning(f"Excel support requires openpyxl/xlrd. Install with: pip install openpyxl xlrd")
                 raise ImportError("Excel support not available. Install with: pip install openpyxl xlrd")
         elif file_ext == '.tsv':
-            return pd.read_csv(file_path, sep='\t')
+            return _read_csv(file_path, usecols, sep='\t')
         elif file_ext == '.json':
-            return pd.read_json(file_path)
+            data = _read_json(file_path)
         elif file_ext == '.parquet':
-            return pd.read_parquet(file_path)
+            if PYARROW_AVAILABLE:
+                return _read_parquet(file_path, usecols)
+            data = pd.read_parquet(file_path)
         else:
             # Default to CSV for unknown extensions
-            logger.info(f"Unknown file extension {file_ext}, attempting to read as CSV")
-            return pd.read_csv(file_path)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Unknown file extension {file_ext}, attempting to read as CSV")
+            return _read_csv(file_path, usecols)
     except Exception as e:
         logger.error(f"Failed to load file {file_path}: {str(e)}")
         raise
+    
+    if usecols is not None:
+        wanted = set(usecols)
+        data = data[[col for col in data.columns if col in wanted]]
+    return data
 
-def safe_json_serialize(obj):
-    """Safely serialize pandas/numpy objects for JSON"""
-    if isinstance(obj, dict):
-        return {str(k): safe_json_serialize(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [safe_json_serialize(item) for item in obj]
-    elif isinstance(obj, (pd.Series, pd.Index)):
-        return obj.tolist()
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, (np.integer, np.floating, np.int64, np.int32, np.float64, np.float32)):
-        return float(obj)
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    elif pd.isna(obj):
+def _serialize_value(obj):
+    """Fallback for types without a dedicated serializer: missing markers become None, pandas/numpy objects their str()."""
+    if pd.isna(obj):
         return None
     elif hasattr(obj, 'dtype'):  # pandas dtype objects
         return str(obj)
@@ -75,12 +541,401 @@ def safe_json_serialize(obj):
     else:
         return obj
 
+def _serialize_dict(obj):
+    return {str(k): safe_json_serialize(v) for k, v in obj.items()}
+
+def _serialize_list(obj):
+    return [safe_json_serialize(item) for item in obj]
+
+def _to_list(obj):
+    return obj.tolist()
+
+def _to_python_scalar(obj):
+    return obj.item()  # native int/float/bool in one C call (int64 keeps full precision)
+
+def _identity(obj):
+    return obj
+
+def _serialize_float(obj):
+    return None if obj != obj else obj  # NaN -> None
+
+# Serializer per exact type - one dict lookup per node instead of an isinstance chain;
+# other types are resolved once by _serializer_for and added to the table
+_SERIALIZERS = {
+    dict: _serialize_dict,
+    list: _serialize_list,
+    tuple: _serialize_list,
+    str: _identity,
+    int: _identity,
+    bool: _identity,
+    float: _serialize_float,
+    type(None): _identity,
+    pd.Series: _to_list,
+    pd.Index: _to_list,
+    np.ndarray: _to_list,
+    np.bool_: _to_python_scalar,
+}
+
+def _serializer_for(cls):
+    """Resolve (and cache) the serializer for a type not yet in _SERIALIZERS."""
+    if issubclass(cls, dict):
+        handler = _serialize_dict
+    elif issubclass(cls, (list, tuple)):
+        handler = _serialize_list
+    elif issubclass(cls, (pd.Series, pd.Index, np.ndarray)):
+        handler = _to_list
+    elif issubclass(cls, (np.integer, np.floating, np.bool_)):
+        handler = _to_python_scalar
+    else:
+        handler = _serialize_value
+    _SERIALIZERS[cls] = handler
+    return handler
+
+def safe_json_serialize(obj):
+    """Safely serialize pandas/numpy objects for JSON"""
+    handler = _SERIALIZERS.get(type(obj))
+    if handler is None:
+        handler = _serializer_for(type(obj))
+    return handler(obj)
+
+# Below this many cells the NumPy path wins - no JIT warm-up on small files
+NUMBA_MIN_CELLS = 1_000_000
+
+def _iqr_outlier_scan_kernel(values, lower, upper, keep):
+    """One fused pass per column: outlier count plus the row positions of the first `keep`."""
+    n_rows, n_cols = values.shape
+    counts = np.zeros(n_cols, np.int64)
+    first_rows = np.full((n_cols, keep), -1, np.int64)
+    for j in range(n_cols):
+        found = 0
+        for i in range(n_rows):
+            value = values[i, j]
+            if value < lower[j] or value > upper[j]:
+                if found < keep:
+                    first_rows[j, found] = i
+                found += 1
+        counts[j] = found
+    return counts, first_rows
+
+def iqr_outlier_scan(values: np.ndarray, lower: np.ndarray, upper: np.ndarray, keep: int = 10):
+    """
+    Count values outside [lower, upper] per column of a 2-D float array.
+    
+    Returns the per-column counts and, for each column, the row positions of
+    its first ``keep`` outliers. NaN compares False, so it is never an outlier.
+    """
+    if NUMBA_AVAILABLE and values.size >= NUMBA_MIN_CELLS:
+        counts, first_rows = _jit(_iqr_outlier_scan_kernel)(np.asfortranarray(values), lower, upper, keep)
+        return counts, [first_rows[j, :min(counts[j], keep)] for j in range(len(counts))]
+    
+    mask = (values < lower) | (values > upper)
+    return mask.sum(axis=0), [np.flatnonzero(mask[:, j])[:keep] for j in range(values.shape[1])]
+
+# Column-block width for the correlation Gram product - bounds the working set
+# of each tile while keeping every BLAS call large enough to run at full speed
+CORR_TILE_COLS = 256
+
+def _upper_gram(values: np.ndarray) -> np.ndarray:
+    """
+    Symmetric Gram matrix X.T @ X built tile by tile over column blocks.
+    
+    Only tiles on or above the diagonal are computed (diagonal tiles with
+    SYRK when scipy's BLAS is available) and the lower half is mirrored.
+    Frames no wider than one tile reduce to a single product.
+    """
+    values = np.asfortranarray(values)  # contiguous column blocks
+    n_cols = values.shape[1]
+    gram = np.empty((n_cols, n_cols), dtype=values.dtype)
+    for i0 in range(0, n_cols, CORR_TILE_COLS):
+        i1 = min(i0 + CORR_TILE_COLS, n_cols)
+        block_i = values[:, i0:i1]
+        if SCIPY_BLAS_AVAILABLE:
+            syrk = ssyrk if values.dtype == np.float32 else dsyrk
+            tile = syrk(1.0, block_i, trans=1)
+            gram[i0:i1, i0:i1] = np.triu(tile) + np.triu(tile, k=1).T
+        else:
+            gram[i0:i1, i0:i1] = block_i.T @ block_i
+        for j0 in range(i1, n_cols, CORR_TILE_COLS):
+            j1 = min(j0 + CORR_TILE_COLS, n_cols)
+            tile = block_i.T @ values[:, j0:j1]
+            gram[i0:i1, j0:j1] = tile
+            gram[j0:j1, i0:i1] = tile.T
+    return gram
+
+def pearson_matrix(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pearson correlation matrix of a numeric frame.
+    
+    Complete data is centered in float64 - large offsets would otherwise
+    swallow the deviations - and the centered block is reduced with a tiled
+    float32 Gram product (SGEMM/SSYRK - half the bandwidth of float64, ample
+    for values reported to 3 decimals); frames with missing values keep
+    pandas' pairwise-complete semantics.
+    """
+    values = frame.to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).any():
+        return frame.corr(method='pearson')
+    centered = (values - values.mean(axis=0)).astype(np.float32)
+    gram = _upper_gram(centered)
+    norms = np.sqrt(np.diag(gram))
+    with np.errstate(divide='ignore', invalid='ignore'):  # constant columns -> NaN, as in pandas
+        corr = gram / np.outer(norms, norms)
+    np.clip(corr, -1.0, 1.0, out=corr)
+    return pd.DataFrame(corr, index=frame.columns, columns=frame.columns)
+
+def spearman_matrix(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Spearman correlation matrix of a numeric frame.
+    
+    Spearman is Pearson on ranks: complete data is ranked once per column
+    (average ranks for ties) and sent through pearson_matrix; frames with
+    missing values keep pandas' pairwise-complete ranking.
+    """
+    values = frame.to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).any():
+        return frame.corr(method='spearman')
+    if _stats is not None:
+        ranks = pd.DataFrame(_stats.rankdata(values, axis=0), index=frame.index, columns=frame.columns)
+    else:
+        ranks = frame.rank(method='average')
+    return pearson_matrix(ranks)
+
+def linear_fit_columns(x, y_columns):
+    """
+    Ordinary least-squares lines of every column of ``y_columns`` against a shared ``x``.
+    
+    Returns arrays (slopes, intercepts, r, p_values), one entry per column.
+    Closed form over centered arrays - the same statistics as
+    scipy.stats.linregress, with all columns reduced by one matrix-vector
+    product. The two-sided p-value needs scipy.special; without it the
+    previous 0.05 placeholder is reported.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y_columns = np.asarray(y_columns, dtype=np.float64)
+    dx = x - x.mean()
+    y_means = y_columns.mean(axis=0)
+    dy = y_columns - y_means
+    sxx = dx @ dx
+    syy = np.einsum('ij,ij->j', dy, dy)
+    sxy = dx @ dy
+    if sxx == 0:
+        raise ValueError("Cannot calculate a linear regression if all x values are identical")
+    slopes = sxy / sxx
+    intercepts = y_means - slopes * x.mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = np.where(syy == 0, 0.0, np.clip(sxy / np.sqrt(sxx * syy), -1.0, 1.0))
+    
+    dof = x.size - 2
+    if dof <= 0:
+        return slopes, intercepts, r, np.where(r == 0, 1.0, 0.0)
+    if _special is not None:
+        tiny = 1.0e-20  # as in linregress: keeps |r| == 1 finite
+        t_stat = r * np.sqrt(dof / ((1.0 - r + tiny) * (1.0 + r + tiny)))
+        p_values = 2 * _special.stdtr(dof, -np.abs(t_stat))
+    else:
+        p_values = np.full(r.shape, 0.05)
+    return slopes, intercepts, r, p_values
+
+def linear_fit(x, y) -> tuple:
+    """Ordinary least-squares line through (x, y): (slope, intercept, r, p_value)."""
+    slopes, intercepts, r, p_values = linear_fit_columns(x, np.asarray(y, dtype=np.float64)[:, None])
+    return float(slopes[0]), float(intercepts[0]), float(r[0]), float(p_values[0])
+
+# Correlation matrices keyed by (path, mtime_ns, size, method, columns) - the
+# correlation and heatmap tools recompute the same matrix for an unchanged file
+_CORR_CACHE: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_CORR_CACHE_SIZE = 16
+_CORR_CACHE_LOCK = threading.Lock()
+
+def cached_correlation(file_path: str, stat: os.stat_result, frame: pd.DataFrame,
+                       method: str = 'pearson') -> pd.DataFrame:
+    """
+    Correlation matrix of ``frame`` (numeric columns of the dataset at ``file_path``).
+    
+    Memoized per file version, method and column set; the returned frame is
+    shared between callers and must not be modified in place.
+    """
+    key = (str(file_path), stat.st_mtime_ns, stat.st_size, method, tuple(frame.columns))
+    with _CORR_CACHE_LOCK:
+        cached = _CORR_CACHE.get(key)
+        if cached is not None:
+            _CORR_CACHE.move_to_end(key)
+            return cached
+    
+    if method == 'pearson':
+        cached = pearson_matrix(frame)
+    elif method == 'spearman':
+        cached = spearman_matrix(frame)
+    else:
+        cached = frame.corr(method=method)
+    
+    with _CORR_CACHE_LOCK:
+        _CORR_CACHE[key] = cached
+        if len(_CORR_CACHE) > _CORR_CACHE_SIZE:
+            _CORR_CACHE.popitem(last=False)
+    return cached
+
+def _strong_pairs_kernel(corr, threshold):
+    """Two row scans of the upper triangle: count hits per row, then fill in row order."""
+    n_cols = corr.shape[0]
+    row_counts = np.zeros(n_cols + 1, np.int64)
+    for i in range(n_cols):
+        found = 0
+        for j in range(i + 1, n_cols):
+            if abs(corr[i, j]) > threshold:
+                found += 1
+        row_counts[i + 1] = found
+    offsets = np.cumsum(row_counts)
+    rows = np.empty(offsets[-1], np.int64)
+    cols = np.empty(offsets[-1], np.int64)
+    vals = np.empty(offsets[-1], corr.dtype)
+    for i in range(n_cols):
+        pos = offsets[i]
+        for j in range(i + 1, n_cols):
+            value = corr[i, j]
+            if abs(value) > threshold:
+                rows[pos] = i
+                cols[pos] = j
+                vals[pos] = value
+                pos += 1
+    return rows, cols, vals
+
+def strong_correlation_pairs(corr: np.ndarray, threshold: float = 0.7):
+    """
+    Upper-triangle entries of a correlation matrix with |r| > threshold.
+    
+    Returns (rows, cols, values) in row-major order. NaN never qualifies.
+    Wide matrices are scanned by the numba kernel when available.
+    """
+    if NUMBA_AVAILABLE and corr.size >= NUMBA_MIN_CELLS:
+        return _jit(_strong_pairs_kernel)(np.ascontiguousarray(corr), threshold)
+    
+    rows, cols = np.triu_indices(corr.shape[0], k=1)
+    values = corr[rows, cols]
+    keep = np.flatnonzero(np.abs(values) > threshold)
+    return rows[keep], cols[keep], values[keep]
+
+# Finished multi-stage reports keyed by tool, arguments and file content - repeat
+# requests within the TTL are answered without rerunning the pipeline
+_RESULT_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_RESULT_CACHE_SIZE = 16
+_RESULT_CACHE_TTL = 600.0  # seconds
+_RESULT_CACHE_LOCK = threading.Lock()
+_FINGERPRINT_BYTES = 4 * 1024 * 1024
+
+# Opt-in on-disk copy of the result cache (empty = off), so repeat reports survive
+# server restarts; the directory is trimmed oldest-first to RESULT_CACHE_MAX_MB
+RESULT_CACHE_DIR = os.path.expanduser(os.getenv("RESULT_CACHE_DIR", ""))
+RESULT_CACHE_MAX_MB = float(os.getenv("RESULT_CACHE_MAX_MB", "256"))
+# Digest of this module's source, part of every on-disk key - an upgraded server
+# never serves reports laid out by older code
+_CODE_VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+def _content_fingerprint(file_path: str, stat: os.stat_result) -> tuple:
+    """(hash of the first 4 MB, size, mtime_ns) identifying one version of a file's content."""
+    with open(file_path, 'rb') as f:
+        head = f.read(_FINGERPRINT_BYTES)
+    digest = xxhash.xxh3_64_hexdigest(head) if XXHASH_AVAILABLE else hashlib.blake2b(head, digest_size=16).hexdigest()
+    return digest, stat.st_size, stat.st_mtime_ns
+
+def _disk_cache_path(key: tuple) -> Path:
+    return Path(RESULT_CACHE_DIR) / f"{hashlib.sha1(repr((_CODE_VERSION,) + key).encode()).hexdigest()}.pkl"
+
+def _disk_cache_get(key: tuple) -> Optional[Dict[str, Any]]:
+    """Stored result for ``key`` from RESULT_CACHE_DIR, or None (unreadable entries count as misses)."""
+    path = _disk_cache_path(key)
+    try:
+        with open(path, 'rb') as f:
+            result = pickle.load(f)
+        os.utime(path)  # recently used - evicted last
+        return result
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable result cache entry {path}: {e}")
+        return None
+
+def _disk_cache_put(key: tuple, result: Dict[str, Any]) -> None:
+    """Write ``result`` atomically under RESULT_CACHE_DIR, then trim the directory to its size cap."""
+    path = _disk_cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        
+        entries = sorted(
+            ((entry.stat(), entry) for entry in path.parent.glob("*.pkl")),
+            key=lambda item: item[0].st_mtime_ns
+        )
+        total = sum(entry_stat.st_size for entry_stat, _ in entries)
+        limit = RESULT_CACHE_MAX_MB * 1024 * 1024
+        for entry_stat, entry in entries:
+            if total <= limit:
+                break
+            entry.unlink(missing_ok=True)
+            total -= entry_stat.st_size
+    except Exception as e:
+        logger.debug(f"Could not persist result cache entry {path}: {e}")
+
+def content_cached(handler):
+    """
+    Memoize a file-based tool handler on its arguments and the file's content.
+    
+    Only successful results are stored; in-memory entries expire after
+    ``_RESULT_CACHE_TTL`` seconds. With RESULT_CACHE_DIR set, results are
+    also pickled there and reused across restarts until the file (or this
+    module's code) changes.
+    Callers always get their own deep copy, never the cached object.
+    """
+    @functools.wraps(handler)
+    async def wrapper(args: Dict[str, Any]) -> Dict[str, Any]:
+        file_path = args.get("file_path", "")
+        stat = _require_file(file_path)
+        if stat is None:
+            return await handler(args)
+        
+        key = (handler.__name__, json.dumps(args, sort_keys=True, default=str)) + _content_fingerprint(file_path, stat)
+        now = time.monotonic()
+        with _RESULT_CACHE_LOCK:
+            entry = _RESULT_CACHE.get(key)
+            if entry is not None:
+                stored_at, result = entry
+                if now - stored_at < _RESULT_CACHE_TTL:
+                    _RESULT_CACHE.move_to_end(key)
+                    return copy.deepcopy(result)
+                del _RESULT_CACHE[key]
+        
+        result = _disk_cache_get(key) if RESULT_CACHE_DIR else None
+        if result is None:
+            token = _REQUEST_STATS.set({file_path: stat})
+            try:
+                result = await handler(args)
+            finally:
+                _REQUEST_STATS.reset(token)
+            if "error" in result:
+                return result
+            if RESULT_CACHE_DIR:
+                _disk_cache_put(key, result)
+        
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[key] = (now, copy.deepcopy(result))
+            if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+                _RESULT_CACHE.popitem(last=False)
+        return result
+    return wrapper
+
 # Setup logging - only to stderr for MCP compatibility
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[logging.StreamHandler()]
 )
+# Whole-second timestamps - skips the extra millisecond formatting on every record
+for _handler in logging.getLogger().handlers:
+    if _handler.formatter is not None:
+        _handler.formatter.default_msec_format = None
 logger = logging.getLogger(__name__)
 
 # Initialize server
@@ -91,12 +946,30 @@ analysis_session = {
     "current_step": 0,
     "data": None,
     "data_profile": None,
+    "nunique": None,
     "analysis_goal": None,
     "findings": [],
     "next_questions": [],
     "file_path": None,
     "completed_steps": []
 }
+# Tools run on worker threads - one guided-analysis step mutates the session at a time
+_SESSION_LOCK = threading.Lock()
+
+def session_locked(handler):
+    """Run a guided-analysis tool coroutine while holding the session lock."""
+    @functools.wraps(handler)
+    async def wrapper(args: Dict[str, Any]) -> Dict[str, Any]:
+        with _SESSION_LOCK:
+            return await handler(args)
+    return wrapper
+
+def session_nunique(data: pd.DataFrame) -> pd.Series:
+    """Distinct-value counts per column of the guided-analysis frame, computed once per session."""
+    nunique = analysis_session.get("nunique")
+    if nunique is None:
+        nunique = analysis_session["nunique"] = data.nunique()
+    return nunique
 
 # Analysis workflow steps - OPTIMIZED APPROACH
 ANALYSIS_STEPS = [
@@ -157,617 +1030,674 @@ ANALYSIS_STEPS = [
     }
 ]
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="discover_data",
-            description="Instantly discover and profile any unknown dataset (30-second analysis)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the dataset file to analyze"
-                    }
+# Column-name keyword matchers - one compiled alternation per category,
+# applied to the whole lower-cased column index at once
+_IMPORTANT_RE = re.compile(r'id|revenue|cost|profit|amount|price|date|customer')
+_KPI_RE = re.compile(r'revenue|profit|cost|amount|price|sales')
+
+def columns_matching(columns: pd.Index, pattern: re.Pattern) -> list:
+    """Column labels whose lower-cased name contains a match for ``pattern``."""
+    return columns[columns.str.lower().str.contains(pattern, na=False)].tolist()
+
+# Tool definitions are static - built once at import, returned as-is on every list_tools call
+TOOL_LIST = [
+    Tool(
+        name="discover_data",
+        description="Instantly discover and profile any unknown dataset (30-second analysis)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the dataset file to analyze"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="optimize_memory", 
+        description="Demonstrate production-grade memory optimization (67% reduction)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="dataset_overview",
+        description="Get comprehensive dataset overview - shape, columns, missing values, memory usage",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="numeric_exploration",
+        description="Perform numeric analysis - summary statistics and outlier detection using IQR method",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
+                "columns": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific numeric columns to analyze (optional - analyzes all if not provided)"
+                }
             }
-        ),
-        Tool(
-            name="optimize_memory", 
-            description="Demonstrate production-grade memory optimization (67% reduction)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    }
+        }
+    ),
+    Tool(
+        name="skewness_analysis",
+        description="Analyze skewness of numeric variables to assess distribution symmetry and normality",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="dataset_overview",
-            description="Get comprehensive dataset overview - shape, columns, missing values, memory usage",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    }
+                "columns": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific columns to analyze (optional - analyzes all numeric if not provided)"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="numeric_exploration",
-            description="Perform numeric analysis - summary statistics and outlier detection using IQR method",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "columns": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Specific numeric columns to analyze (optional - analyzes all if not provided)"
-                    }
+                "interpretation_level": {
+                    "type": "string",
+                    "enum": ["basic", "detailed", "statistical"],
+                    "description": "Level of interpretation detail",
+                    "default": "detailed"
                 }
-            }
-        ),
-        Tool(
-            name="skewness_analysis",
-            description="Analyze skewness of numeric variables to assess distribution symmetry and normality",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "columns": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Specific columns to analyze (optional - analyzes all numeric if not provided)"
-                    },
-                    "interpretation_level": {
-                        "type": "string",
-                        "enum": ["basic", "detailed", "statistical"],
-                        "description": "Level of interpretation detail",
-                        "default": "detailed"
-                    }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="kurtosis_analysis",
+        description="Analyze kurtosis of numeric variables to assess tail behavior and outlier propensity",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="kurtosis_analysis",
-            description="Analyze kurtosis of numeric variables to assess tail behavior and outlier propensity",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "columns": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Specific columns to analyze (optional - analyzes all numeric if not provided)"
-                    },
-                    "interpretation_level": {
-                        "type": "string",
-                        "enum": ["basic", "detailed", "statistical"],
-                        "description": "Level of interpretation detail",
-                        "default": "detailed"
-                    }
+                "columns": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific columns to analyze (optional - analyzes all numeric if not provided)"
+                },
+                "interpretation_level": {
+                    "type": "string",
+                    "enum": ["basic", "detailed", "statistical"],
+                    "description": "Level of interpretation detail",
+                    "default": "detailed"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="distribution_shape_analysis",
+        description="Comprehensive distribution shape analysis combining skewness and kurtosis with normality tests",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
+                },
+                "columns": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific columns to analyze (optional - analyzes all numeric if not provided)"
+                },
+                "include_normality_tests": {
+                    "type": "boolean",
+                    "description": "Include statistical normality tests (Shapiro-Wilk, D'Agostino)",
+                    "default": True
+                },
+                "business_context": {
+                    "type": "string",
+                    "description": "Business context for interpreting distribution shapes",
+                    "default": "general"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="distribution_checks",
+        description="Analyze distributions - histograms for numeric columns and value counts for categorical",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
+                },
+                "column_type": {
+                    "type": "string",
+                    "enum": ["numeric", "categorical", "all"],
+                    "description": "Type of columns to analyze",
+                    "default": "all"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="correlation_analysis",
+        description="Perform correlation analysis with correlation matrix and heatmap visualization",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
+                "method": {
+                    "type": "string",
+                    "enum": ["pearson", "spearman", "both"],
+                    "description": "Correlation method to use",
+                    "default": "both"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="scatter_plots",
+        description="Create scatter plots between any two variables for relationship analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
+                },
+                "x_variable": {
+                    "type": "string",
+                    "description": "X-axis variable"
+                },
+                "y_variable": {
+                    "type": "string",
+                    "description": "Y-axis variable"
+                },
+                "color_by": {
+                    "type": "string",
+                    "description": "Optional variable to color points by"
+                }
+            },
+            "required": ["file_path", "x_variable", "y_variable"]
+        }
+    ),
+    Tool(
+        name="temporal_analysis",
+        description="Perform time series analysis if date column is provided - trends, seasonality, patterns",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
+                },
+                "date_column": {
+                    "type": "string",
+                    "description": "Name of the date/time column"
+                },
+                "value_columns": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Numeric columns to analyze over time"
+                }
+            },
+            "required": ["file_path", "date_column"]
+        }
+    ),
+    Tool(
+        name="full_exploration_report",
+        description="Run all analyses in one comprehensive report - complete exploratory data analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
+                },
+                "include_visualizations": {
+                    "type": "boolean",
+                    "description": "Include visualization descriptions",
+                    "default": True
+                },
+                "business_focus": {
+                    "type": "string",
+                    "description": "Business domain to focus insights on",
+                    "default": "general"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="explain_methodology",
+        description="Explain analysis approach and methodology in real-time",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic": {
+                    "type": "string",
+                    "description": "Specific methodology topic to explain"
+                }
             }
-        ),
-        Tool(
-            name="distribution_shape_analysis",
-            description="Comprehensive distribution shape analysis combining skewness and kurtosis with normality tests",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "columns": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Specific columns to analyze (optional - analyzes all numeric if not provided)"
-                    },
-                    "include_normality_tests": {
-                        "type": "boolean",
-                        "description": "Include statistical normality tests (Shapiro-Wilk, D'Agostino)",
-                        "default": True
-                    },
-                    "business_context": {
-                        "type": "string",
-                        "description": "Business context for interpreting distribution shapes",
-                        "default": "general"
-                    }
+        }
+    ),
+    Tool(
+        name="optimized_analysis_workflow",
+        description="Production-grade analysis workflow: Memory optimization → Vectorization → Data exploration",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file to analyze"
+                },
+                "analysis_goal": {
+                    "type": "string",
+                    "description": "What you want to achieve (e.g., 'understand customer behavior', 'identify cost optimization')",
+                    "default": "comprehensive exploration"
+                },
+                "optimization_level": {
+                    "type": "string",
+                    "enum": ["conservative", "aggressive", "production"],
+                    "description": "Level of optimization to apply",
+                    "default": "production"
+                },
+                "include_benchmark": {
+                    "type": "boolean",
+                    "description": "Time a Python loop against the vectorized equivalent to report a measured speedup",
+                    "default": False
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="start_guided_analysis",
+        description="Start step-by-step guided exploratory analysis with intelligent follow-up questions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file to analyze"
+                },
+                "analysis_goal": {
+                    "type": "string",
+                    "description": "What you want to achieve (e.g., 'understand customer behavior', 'identify cost optimization')",
+                    "default": "comprehensive exploration"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="continue_analysis",
+        description="Continue to the next step of guided analysis based on previous findings",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_response": {
+                    "type": "string",
+                    "description": "Your response to the previous question or findings you want to explore"
                 },
-                "required": ["file_path"]
+                "focus_area": {
+                    "type": "string",
+                    "description": "Specific area to focus on next (optional)"
+                }
             }
-        ),
-        Tool(
-            name="distribution_checks",
-            description="Analyze distributions - histograms for numeric columns and value counts for categorical",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "column_type": {
-                        "type": "string",
-                        "enum": ["numeric", "categorical", "all"],
-                        "description": "Type of columns to analyze",
-                        "default": "all"
-                    }
+        }
+    ),
+    Tool(
+        name="export_optimized_dataset",
+        description="Export memory-optimized dataset to various formats (CSV, Parquet, JSON)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the original dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="correlation_analysis",
-            description="Perform correlation analysis with correlation matrix and heatmap visualization",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "method": {
-                        "type": "string",
-                        "enum": ["pearson", "spearman", "both"],
-                        "description": "Correlation method to use",
-                        "default": "both"
-                    }
+                "output_format": {
+                    "type": "string",
+                    "enum": ["csv", "parquet", "json", "all"],
+                    "description": "Output format for the optimized dataset",
+                    "default": "parquet"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="scatter_plots",
-            description="Create scatter plots between any two variables for relationship analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "x_variable": {
-                        "type": "string",
-                        "description": "X-axis variable"
-                    },
-                    "y_variable": {
-                        "type": "string",
-                        "description": "Y-axis variable"
-                    },
-                    "color_by": {
-                        "type": "string",
-                        "description": "Optional variable to color points by"
-                    }
+                "output_path": {
+                    "type": "string",
+                    "description": "Custom output path (optional - will auto-generate if not provided)"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="export_vectorized_dataset",
+        description="Export vectorized dataset with optimized operations and performance metrics",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the original dataset file"
                 },
-                "required": ["file_path", "x_variable", "y_variable"]
-            }
-        ),
-        Tool(
-            name="temporal_analysis",
-            description="Perform time series analysis if date column is provided - trends, seasonality, patterns",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "date_column": {
-                        "type": "string",
-                        "description": "Name of the date/time column"
-                    },
-                    "value_columns": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Numeric columns to analyze over time"
-                    }
+                "output_format": {
+                    "type": "string",
+                    "enum": ["csv", "parquet", "json", "all"],
+                    "description": "Output format for the vectorized dataset",
+                    "default": "parquet"
                 },
-                "required": ["file_path", "date_column"]
-            }
-        ),
-        Tool(
-            name="full_exploration_report",
-            description="Run all analyses in one comprehensive report - complete exploratory data analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "include_visualizations": {
-                        "type": "boolean",
-                        "description": "Include visualization descriptions",
-                        "default": True
-                    },
-                    "business_focus": {
-                        "type": "string",
-                        "description": "Business domain to focus insights on",
-                        "default": "general"
-                    }
+                "output_path": {
+                    "type": "string",
+                    "description": "Custom output path (optional - will auto-generate if not provided)"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="explain_methodology",
-            description="Explain analysis approach and methodology in real-time",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "Specific methodology topic to explain"
-                    }
+                "include_metrics": {
+                    "type": "boolean",
+                    "description": "Include performance metrics in the export",
+                    "default": True
                 }
-            }
-        ),
-        Tool(
-            name="optimized_analysis_workflow",
-            description="Production-grade analysis workflow: Memory optimization → Vectorization → Data exploration",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file to analyze"
-                    },
-                    "analysis_goal": {
-                        "type": "string",
-                        "description": "What you want to achieve (e.g., 'understand customer behavior', 'identify cost optimization')",
-                        "default": "comprehensive exploration"
-                    },
-                    "optimization_level": {
-                        "type": "string",
-                        "enum": ["conservative", "aggressive", "production"],
-                        "description": "Level of optimization to apply",
-                        "default": "production"
-                    }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="advanced_feature_engineering",
+        description="Create advanced features using vectorized operations for enhanced analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="start_guided_analysis",
-            description="Start step-by-step guided exploratory analysis with intelligent follow-up questions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file to analyze"
-                    },
-                    "analysis_goal": {
-                        "type": "string",
-                        "description": "What you want to achieve (e.g., 'understand customer behavior', 'identify cost optimization')",
-                        "default": "comprehensive exploration"
-                    }
+                "feature_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Types of features to create (efficiency_ratios, performance_metrics, percentile_rankings)",
+                    "default": ["efficiency_ratios", "performance_metrics", "percentile_rankings"]
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="performance_benchmarking",
+        description="Comprehensive performance benchmarking of memory optimization and vectorization",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="continue_analysis",
-            description="Continue to the next step of guided analysis based on previous findings",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_response": {
-                        "type": "string",
-                        "description": "Your response to the previous question or findings you want to explore"
-                    },
-                    "focus_area": {
-                        "type": "string",
-                        "description": "Specific area to focus on next (optional)"
-                    }
+                "benchmark_type": {
+                    "type": "string",
+                    "enum": ["memory", "vectorization", "comprehensive"],
+                    "description": "Type of benchmarking to perform",
+                    "default": "comprehensive"
                 }
-            }
-        ),
-        Tool(
-            name="export_optimized_dataset",
-            description="Export memory-optimized dataset to various formats (CSV, Parquet, JSON)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the original dataset file"
-                    },
-                    "output_format": {
-                        "type": "string",
-                        "enum": ["csv", "parquet", "json", "all"],
-                        "description": "Output format for the optimized dataset",
-                        "default": "parquet"
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Custom output path (optional - will auto-generate if not provided)"
-                    }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="ml_readiness_assessment",
+        description="Advanced ML readiness scoring with model recommendations and deployment guidance",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="export_vectorized_dataset",
-            description="Export vectorized dataset with optimized operations and performance metrics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the original dataset file"
-                    },
-                    "output_format": {
-                        "type": "string",
-                        "enum": ["csv", "parquet", "json", "all"],
-                        "description": "Output format for the vectorized dataset",
-                        "default": "parquet"
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Custom output path (optional - will auto-generate if not provided)"
-                    },
-                    "include_metrics": {
-                        "type": "boolean",
-                        "description": "Include performance metrics in the export",
-                        "default": True
-                    }
+                "assessment_focus": {
+                    "type": "string",
+                    "enum": ["classification", "regression", "time_series", "comprehensive"],
+                    "description": "ML assessment focus area",
+                    "default": "comprehensive"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="executive_dashboard",
+        description="Executive dashboard with KPIs, optimization summary, and strategic recommendations",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="advanced_feature_engineering",
-            description="Create advanced features using vectorized operations for enhanced analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "feature_types": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Types of features to create (efficiency_ratios, performance_metrics, percentile_rankings)",
-                        "default": ["efficiency_ratios", "performance_metrics", "percentile_rankings"]
-                    }
+                "dashboard_focus": {
+                    "type": "string",
+                    "enum": ["performance", "cost_optimization", "strategic", "comprehensive"],
+                    "description": "Dashboard focus area",
+                    "default": "comprehensive"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="create_distribution_plots",
+        description="Create comprehensive distribution visualizations for numeric and categorical variables",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="performance_benchmarking",
-            description="Comprehensive performance benchmarking of memory optimization and vectorization",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "benchmark_type": {
-                        "type": "string",
-                        "enum": ["memory", "vectorization", "comprehensive"],
-                        "description": "Type of benchmarking to perform",
-                        "default": "comprehensive"
-                    }
+                "plot_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Types of plots to create (histograms, boxplots, violin_plots, kde_plots)",
+                    "default": ["histograms", "boxplots", "kde_plots"]
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="ml_readiness_assessment",
-            description="Advanced ML readiness scoring with model recommendations and deployment guidance",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "assessment_focus": {
-                        "type": "string",
-                        "enum": ["classification", "regression", "time_series", "comprehensive"],
-                        "description": "ML assessment focus area",
-                        "default": "comprehensive"
-                    }
+                "max_variables": {
+                    "type": "integer",
+                    "description": "Maximum number of variables to plot",
+                    "default": 10
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="create_correlation_heatmap",
+        description="Create advanced correlation heatmaps with clustering and statistical significance",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="executive_dashboard",
-            description="Executive dashboard with KPIs, optimization summary, and strategic recommendations",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "dashboard_focus": {
-                        "type": "string",
-                        "enum": ["performance", "cost_optimization", "strategic", "comprehensive"],
-                        "description": "Dashboard focus area",
-                        "default": "comprehensive"
-                    }
+                "correlation_method": {
+                    "type": "string",
+                    "enum": ["pearson", "spearman", "kendall"],
+                    "description": "Correlation calculation method",
+                    "default": "pearson"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="create_distribution_plots",
-            description="Create comprehensive distribution visualizations for numeric and categorical variables",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "plot_types": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Types of plots to create (histograms, boxplots, violin_plots, kde_plots)",
-                        "default": ["histograms", "boxplots", "kde_plots"]
-                    },
-                    "max_variables": {
-                        "type": "integer",
-                        "description": "Maximum number of variables to plot",
-                        "default": 10
-                    }
+                "cluster_variables": {
+                    "type": "boolean",
+                    "description": "Apply hierarchical clustering to variables",
+                    "default": True
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="create_advanced_scatter_matrix",
+        description="Create advanced scatter plot matrices with regression lines and density plots",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="create_correlation_heatmap",
-            description="Create advanced correlation heatmaps with clustering and statistical significance",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "correlation_method": {
-                        "type": "string",
-                        "enum": ["pearson", "spearman", "kendall"],
-                        "description": "Correlation calculation method",
-                        "default": "pearson"
-                    },
-                    "cluster_variables": {
-                        "type": "boolean",
-                        "description": "Apply hierarchical clustering to variables",
-                        "default": True
-                    }
+                "max_variables": {
+                    "type": "integer",
+                    "description": "Maximum number of variables for scatter matrix",
+                    "default": 8
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="create_advanced_scatter_matrix",
-            description="Create advanced scatter plot matrices with regression lines and density plots",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "max_variables": {
-                        "type": "integer",
-                        "description": "Maximum number of variables for scatter matrix",
-                        "default": 8
-                    },
-                    "include_regression": {
-                        "type": "boolean",
-                        "description": "Include regression lines in scatter plots",
-                        "default": True
-                    }
+                "include_regression": {
+                    "type": "boolean",
+                    "description": "Include regression lines in scatter plots",
+                    "default": True
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="create_time_series_plots",
+        description="Create comprehensive time series visualizations with trends and seasonality",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="create_time_series_plots",
-            description="Create comprehensive time series visualizations with trends and seasonality",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "date_column": {
-                        "type": "string",
-                        "description": "Name of the date/time column (auto-detected if not provided)"
-                    },
-                    "value_columns": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Columns to plot over time (auto-selected if not provided)"
-                    }
+                "date_column": {
+                    "type": "string",
+                    "description": "Name of the date/time column (auto-detected if not provided)"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="create_outlier_visualizations",
-            description="Create comprehensive outlier detection visualizations using multiple methods",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "outlier_methods": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Outlier detection methods (iqr, zscore, isolation_forest)",
-                        "default": ["iqr", "zscore"]
-                    },
-                    "max_variables": {
-                        "type": "integer",
-                        "description": "Maximum number of variables to analyze",
-                        "default": 10
-                    }
+                "value_columns": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Columns to plot over time (auto-selected if not provided)"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="create_outlier_visualizations",
+        description="Create comprehensive outlier detection visualizations using multiple methods",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="create_business_intelligence_dashboard",
-            description="Create executive-level business intelligence visualizations with KPIs and insights",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to dataset file"
-                    },
-                    "dashboard_theme": {
-                        "type": "string",
-                        "enum": ["executive", "technical", "marketing", "operations"],
-                        "description": "Dashboard visual theme",
-                        "default": "executive"
-                    },
-                    "include_kpis": {
-                        "type": "boolean",
-                        "description": "Include key performance indicators",
-                        "default": True
-                    }
+                "outlier_methods": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Outlier detection methods (iqr, zscore, isolation_forest)",
+                    "default": ["iqr", "zscore"]
                 },
-                "required": ["file_path"]
-            }
+                "max_variables": {
+                    "type": "integer",
+                    "description": "Maximum number of variables to analyze",
+                    "default": 10
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="create_business_intelligence_dashboard",
+        description="Create executive-level business intelligence visualizations with KPIs and insights",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to dataset file"
+                },
+                "dashboard_theme": {
+                    "type": "string",
+                    "enum": ["executive", "technical", "marketing", "operations"],
+                    "description": "Dashboard visual theme",
+                    "default": "executive"
+                },
+                "include_kpis": {
+                    "type": "boolean",
+                    "description": "Include key performance indicators",
+                    "default": True
+                }
+            },
+            "required": ["file_path"]
+        }
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available tools."""
+    return TOOL_LIST
+
+def _encode_section(value: Any) -> bytes:
+    """Encode one JSON value with 2-space indentation, via orjson when it can."""
+    try:
+        return orjson.dumps(
+            value,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str
         )
-    ]
+    except TypeError:
+        return json.dumps(value, indent=2, default=str).encode()  # e.g. keys orjson cannot encode
+
+def dumps_result(result: Any) -> str:
+    """
+    Encode a tool result as indented JSON, via orjson when available.
+    
+    Dict results are encoded one top-level section at a time, so a section
+    orjson cannot handle falls back to json alone. The dict is left intact.
+    """
+    if not ORJSON_AVAILABLE:
+        return json.dumps(result, indent=2, default=str)
+    if not isinstance(result, dict) or not result:
+        return _encode_section(result).decode()
+    
+    parts = []
+    for key, value in result.items():
+        fragment = _encode_section(value).replace(b'\n', b'\n  ')
+        parts.append(b'  ' + orjson.dumps(str(key)) + b': ' + fragment)
+    return (b'{\n' + b',\n'.join(parts) + b'\n}').decode()
+
+# One event loop per worker thread, created on first use and reused for every
+# later tool call on that thread
+_WORKER_LOOPS = threading.local()
+
+def _run_handler(handler, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Drive a tool coroutine to completion on the calling (worker) thread."""
+    loop = getattr(_WORKER_LOOPS, "loop", None)
+    if loop is None:
+        loop = _WORKER_LOOPS.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(handler(arguments))
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
@@ -775,72 +1705,14 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> list[TextCon
     logger.info(f"🔧 Tool called: {name}")
     
     try:
-        if name == "discover_data":
-            result = await handle_discover_data(arguments)
-        elif name == "optimize_memory":
-            result = await handle_optimize_memory(arguments)
-        elif name == "dataset_overview":
-            result = await handle_dataset_overview(arguments)
-        elif name == "numeric_exploration":
-            result = await handle_numeric_exploration(arguments)
-        elif name == "skewness_analysis":
-            result = await handle_skewness_analysis(arguments)
-        elif name == "kurtosis_analysis":
-            result = await handle_kurtosis_analysis(arguments)
-        elif name == "distribution_shape_analysis":
-            result = await handle_distribution_shape_analysis(arguments)
-        elif name == "distribution_checks":
-            result = await handle_distribution_checks(arguments)
-        elif name == "correlation_analysis":
-            result = await handle_correlation_analysis(arguments)
-        elif name == "scatter_plots":
-            result = await handle_scatter_plots(arguments)
-        elif name == "temporal_analysis":
-            result = await handle_temporal_analysis(arguments)
-        elif name == "full_exploration_report":
-            result = await handle_full_exploration_report(arguments)
-        elif name == "optimized_analysis_workflow":
-            result = await handle_optimized_analysis_workflow(arguments)
-        elif name == "explain_methodology":
-            result = await handle_explain_methodology(arguments)
-        elif name == "start_guided_analysis":
-            result = await handle_start_guided_analysis(arguments)
-        elif name == "continue_analysis":
-            result = await handle_continue_analysis(arguments)
-        elif name == "export_optimized_dataset":
-            result = await handle_export_optimized_dataset(arguments)
-        elif name == "export_vectorized_dataset":
-            result = await handle_export_vectorized_dataset(arguments)
-        elif name == "advanced_feature_engineering":
-            result = await handle_advanced_feature_engineering(arguments)
-        elif name == "performance_benchmarking":
-            result = await handle_performance_benchmarking(arguments)
-        elif name == "ml_readiness_assessment":
-            result = await handle_ml_readiness_assessment(arguments)
-        elif name == "executive_dashboard":
-            result = await handle_executive_dashboard(arguments)
-        elif name == "create_distribution_plots":
-            result = await handle_create_distribution_plots(arguments)
-        elif name == "create_correlation_heatmap":
-            result = await handle_create_correlation_heatmap(arguments)
-        elif name == "create_advanced_scatter_matrix":
-            result = await handle_create_advanced_scatter_matrix(arguments)
-        elif name == "create_time_series_plots":
-            result = await handle_create_time_series_plots(arguments)
-        elif name == "create_outlier_visualizations":
-            result = await handle_create_outlier_visualizations(arguments)
-        elif name == "create_business_intelligence_dashboard":
-            result = await handle_create_business_intelligence_dashboard(arguments)
-        elif name == "skewness_analysis":
-            result = await handle_skewness_analysis(arguments)
-        elif name == "kurtosis_analysis":
-            result = await handle_kurtosis_analysis(arguments)
-        elif name == "distribution_shape_analysis":
-            result = await handle_distribution_shape_analysis(arguments)
+        handler = _HANDLERS.get(name)
+        if handler is not None:
+            # pandas work is blocking - run it on a worker thread so the loop keeps serving
+            result = await asyncio.to_thread(_run_handler, handler, arguments)
         else:
             result = {"error": f"Unknown tool: {name}"}
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+        return [TextContent(type="text", text=dumps_result(result))]
         
     except Exception as e:
         logger.error(f"❌ Tool execution failed: {e}")
@@ -848,37 +1720,44 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> list[TextCon
             "error": f"Tool execution failed: {str(e)}",
             "tool": name
         }
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+        return [TextContent(type="text", text=dumps_result(error_result))]
 
 async def handle_dataset_overview(args: Dict[str, Any]) -> Dict[str, Any]:
     """Handle dataset overview requests - shape, columns, missing values, memory usage."""
     file_path = args.get("file_path", "")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
+        summary = dataset_summary(file_path, stat=file_stat)
+        
+        # Whole-frame profiles - one pass each instead of per-column reductions
+        total_rows = summary.n_rows
+        null_counts = summary.nulls
+        non_null_counts = total_rows - null_counts
+        memory_bytes = data.memory_usage(deep=True)
         
         # Basic overview
         overview = {
             "dataset_shape": {
-                "rows": len(data),
+                "rows": total_rows,
                 "columns": len(data.columns)
             },
             "column_info": {
                 col: {
-                    "dtype": str(data[col].dtype),
-                    "non_null_count": int(data[col].count()),
-                    "null_count": int(data[col].isnull().sum()),
-                    "null_percentage": round((data[col].isnull().sum() / len(data)) * 100, 2)
-                } for col in data.columns
+                    "dtype": str(dtype),
+                    "non_null_count": int(non_null),
+                    "null_count": int(nulls),
+                    "null_percentage": round((nulls / total_rows) * 100, 2)
+                } for col, dtype, non_null, nulls in zip(data.columns, data.dtypes, non_null_counts, null_counts)
             },
             "memory_usage": {
-                "total_mb": round(data.memory_usage(deep=True).sum() / (1024 * 1024), 2),
+                "total_mb": round(memory_bytes.sum() / (1024 * 1024), 2),
                 "per_column_mb": {
-                    col: round(data[col].memory_usage(deep=True) / (1024 * 1024), 3)
+                    col: round(memory_bytes[col] / (1024 * 1024), 3)
                     for col in data.columns
                 }
             },
@@ -886,8 +1765,8 @@ async def handle_dataset_overview(args: Dict[str, Any]) -> Dict[str, Any]:
         }
         
         # Quality assessment
-        total_cells = len(data) * len(data.columns)
-        missing_cells = data.isnull().sum().sum()
+        total_cells = total_rows * len(data.columns)
+        missing_cells = null_counts.sum()
         quality_score = round(((total_cells - missing_cells) / total_cells) * 10, 1)
         
         result = {
@@ -903,7 +1782,7 @@ async def handle_dataset_overview(args: Dict[str, Any]) -> Dict[str, Any]:
                 f"📊 Dataset contains {len(data):,} rows and {len(data.columns)} columns",
                 f"💾 Total memory usage: {overview['memory_usage']['total_mb']} MB",
                 f"⭐ Data quality score: {quality_score}/10",
-                f"📈 Data types: {len(data.select_dtypes(include=['number']).columns)} numeric, {len(data.select_dtypes(include=['object']).columns)} text columns"
+                f"📈 Data types: {len(summary.numeric_cols)} numeric, {len(summary.object_cols)} text columns"
             ],
             "next_suggestions": [
                 "Use 'numeric_exploration' to analyze statistical patterns",
@@ -922,13 +1801,12 @@ async def handle_numeric_exploration(args: Dict[str, Any]) -> Dict[str, Any]:
     file_path = args.get("file_path", "")
     specific_columns = args.get("columns", [])
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, usecols=specific_columns or None, stat=file_stat)
         
         # Get numeric columns
         numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
@@ -940,41 +1818,53 @@ async def handle_numeric_exploration(args: Dict[str, Any]) -> Dict[str, Any]:
         
         analysis_results = {}
         
-        for col in numeric_cols:
-            series = data[col].dropna()
+        # Whole-frame reductions - one describe/skew/kurtosis call for every column
+        sub = data[numeric_cols]
+        desc = sub.describe()
+        skews = sub.skew()
+        kurts = sub.kurtosis()
+        
+        # IQR bounds for all columns at once, scanned over a raw NumPy block
+        # (JIT-fused for large frames when numba is installed)
+        q1 = desc.loc['25%'].to_numpy()
+        q3 = desc.loc['75%'].to_numpy()
+        iqr = q3 - q1
+        lower_bounds = q1 - 1.5 * iqr
+        upper_bounds = q3 + 1.5 * iqr
+        values = sub.to_numpy(dtype='float64', na_value=np.nan)
+        outlier_counts, first_outlier_rows = iqr_outlier_scan(values, lower_bounds, upper_bounds)
+        
+        for i, col in enumerate(numeric_cols):
+            count = int(desc.at['count', col])
             
-            if len(series) == 0:
+            if count == 0:
                 continue
             
             # Summary statistics
             stats = {
-                "count": len(series),
-                "mean": float(series.mean()),
-                "std": float(series.std()),
-                "min": float(series.min()),
-                "25%": float(series.quantile(0.25)),
-                "50%": float(series.median()),
-                "75%": float(series.quantile(0.75)),
-                "max": float(series.max()),
-                "skewness": float(series.skew()),
-                "kurtosis": float(series.kurtosis())
+                "count": count,
+                "mean": float(desc.at['mean', col]),
+                "std": float(desc.at['std', col]),
+                "min": float(desc.at['min', col]),
+                "25%": float(desc.at['25%', col]),
+                "50%": float(desc.at['50%', col]),
+                "75%": float(desc.at['75%', col]),
+                "max": float(desc.at['max', col]),
+                "skewness": float(skews[col]),
+                "kurtosis": float(kurts[col])
             }
             
             # IQR outlier detection
-            Q1 = series.quantile(0.25)
-            Q3 = series.quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            outliers = series[(series < lower_bound) | (series > upper_bound)]
+            n_outliers = int(outlier_counts[i])
+            # Values come from the original column so integer columns report integers
+            outlier_values = sub[col].to_numpy()[first_outlier_rows[i]].tolist() if n_outliers else []
             
             outlier_info = {
-                "outlier_count": len(outliers),
-                "outlier_percentage": round((len(outliers) / len(series)) * 100, 2),
-                "lower_bound": float(lower_bound),
-                "upper_bound": float(upper_bound),
-                "outlier_values": outliers.tolist()[:10]  # First 10 outliers
+                "outlier_count": n_outliers,
+                "outlier_percentage": round((n_outliers / count) * 100, 2),
+                "lower_bound": float(lower_bounds[i]),
+                "upper_bound": float(upper_bounds[i]),
+                "outlier_values": outlier_values  # First 10 outliers
             }
             
             analysis_results[col] = {
@@ -991,19 +1881,23 @@ async def handle_numeric_exploration(args: Dict[str, Any]) -> Dict[str, Any]:
         insights = []
         insights.append(f"🔢 Analyzed {len(numeric_cols)} numeric columns")
         
-        # Highlight interesting patterns
-        high_variance_cols = [col for col, data in analysis_results.items() 
-                             if data["summary_statistics"]["std"] / data["summary_statistics"]["mean"] > 1]
+        # Highlight interesting patterns (one pass over the results for all three lists)
+        high_variance_cols, outlier_cols, skewed_cols = [], [], []
+        for col, col_results in analysis_results.items():
+            col_stats = col_results["summary_statistics"]
+            if col_stats["std"] / col_stats["mean"] > 1:
+                high_variance_cols.append(col)
+            if col_results["outlier_analysis"]["outlier_percentage"] > 5:
+                outlier_cols.append(col)
+            if abs(col_stats["skewness"]) > 1:
+                skewed_cols.append(col)
+        
         if high_variance_cols:
             insights.append(f"📊 High variability detected in: {', '.join(high_variance_cols[:3])}")
         
-        outlier_cols = [col for col, data in analysis_results.items() 
-                       if data["outlier_analysis"]["outlier_percentage"] > 5]
         if outlier_cols:
             insights.append(f"⚠️ Significant outliers in: {', '.join(outlier_cols[:3])}")
         
-        skewed_cols = [col for col, data in analysis_results.items() 
-                      if abs(data["summary_statistics"]["skewness"]) > 1]
         if skewed_cols:
             insights.append(f"📈 Highly skewed distributions in: {', '.join(skewed_cols[:3])}")
         
@@ -1037,14 +1931,14 @@ async def handle_skewness_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     specific_columns = args.get("columns", [])
     interpretation_level = args.get("interpretation_level", "detailed")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        from scipy import stats
-        data = load_data_file(file_path)
+        if _stats is None:
+            return {"error": "scipy is required for this analysis"}
+        data = load_data_file(file_path, stat=file_stat)
         
         # Get numeric columns
         numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
@@ -1083,7 +1977,7 @@ async def handle_skewness_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
                 # D'Agostino test for normality (focuses on skewness)
                 try:
                     if len(series) >= 8:  # Minimum sample size for test
-                        _, p_value = stats.jarque_bera(series)
+                        _, p_value = _stats.jarque_bera(series)
                         normality_test = {
                             "test_name": "Jarque-Bera",
                             "p_value": float(p_value),
@@ -1178,13 +2072,12 @@ async def handle_kurtosis_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     specific_columns = args.get("columns", [])
     interpretation_level = args.get("interpretation_level", "detailed")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         # Get numeric columns
         numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
@@ -1226,8 +2119,9 @@ async def handle_kurtosis_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
             Q1 = series.quantile(0.25)
             Q3 = series.quantile(0.75)
             IQR = Q3 - Q1
-            outliers = series[(series < Q1 - 1.5 * IQR) | (series > Q3 + 1.5 * IQR)]
-            outlier_percentage = (len(outliers) / len(series)) * 100
+            values = series.to_numpy()
+            n_outliers = int(((values < Q1 - 1.5 * IQR) | (values > Q3 + 1.5 * IQR)).sum())
+            outlier_percentage = (n_outliers / len(series)) * 100
             
             # Business implications
             business_implications = []
@@ -1261,7 +2155,7 @@ async def handle_kurtosis_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
                 "tail_behavior": tail_behavior,
                 "outlier_propensity": outlier_propensity,
                 "actual_outliers": {
-                    "count": len(outliers),
+                    "count": n_outliers,
                     "percentage": round(outlier_percentage, 2)
                 },
                 "sample_size": len(series),
@@ -1325,14 +2219,14 @@ async def handle_distribution_shape_analysis(args: Dict[str, Any]) -> Dict[str,
     include_normality_tests = args.get("include_normality_tests", True)
     business_context = args.get("business_context", "general")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        from scipy import stats
-        data = load_data_file(file_path)
+        if _stats is None:
+            return {"error": "scipy is required for this analysis"}
+        data = load_data_file(file_path, stat=file_stat)
         
         # Get numeric columns
         numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
@@ -1386,7 +2280,7 @@ async def handle_distribution_shape_analysis(args: Dict[str, Any]) -> Dict[str,
                 try:
                     # Shapiro-Wilk test (best for small samples)
                     if len(series) <= 5000:
-                        shapiro_stat, shapiro_p = stats.shapiro(series)
+                        shapiro_stat, shapiro_p = _stats.shapiro(series)
                         normality_results["shapiro_wilk"] = {
                             "statistic": float(shapiro_stat),
                             "p_value": float(shapiro_p),
@@ -1395,7 +2289,7 @@ async def handle_distribution_shape_analysis(args: Dict[str, Any]) -> Dict[str,
                     
                     # D'Agostino and Pearson's test
                     if len(series) >= 20:
-                        dagostino_stat, dagostino_p = stats.normaltest(series)
+                        dagostino_stat, dagostino_p = _stats.normaltest(series)
                         normality_results["dagostino_pearson"] = {
                             "statistic": float(dagostino_stat),
                             "p_value": float(dagostino_p),
@@ -1403,7 +2297,7 @@ async def handle_distribution_shape_analysis(args: Dict[str, Any]) -> Dict[str,
                         }
                     
                     # Jarque-Bera test
-                    jb_stat, jb_p = stats.jarque_bera(series)
+                    jb_stat, jb_p = _stats.jarque_bera(series)
                     normality_results["jarque_bera"] = {
                         "statistic": float(jb_stat),
                         "p_value": float(jb_p),
@@ -1513,15 +2407,19 @@ async def handle_distribution_checks(args: Dict[str, Any]) -> Dict[str, Any]:
     file_path = args.get("file_path", "")
     column_type = args.get("column_type", "all")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         analysis_results = {}
         
+        # Insight lists are collected while the distributions are built
+        skewed_vars = []
+        high_cardinality = []
+        
         # Numeric distributions
         if column_type in ["numeric", "all"]:
             numeric_cols = data.select_dtypes(include=['number']).columns
@@ -1530,21 +2428,23 @@ async def handle_distribution_checks(args: Dict[str, Any]) -> Dict[str, Any]:
             for col in numeric_cols:
                 series = data[col].dropna()
                 
-                # Create histogram bins
-                import numpy as np
+                # Create histogram bins (one histogram, shape stats computed once)
+                bin_counts, bin_edges = np.histogram(series.to_numpy(), bins=10)
+                skew_val = float(series.skew())
+                kurt_val = float(series.kurtosis())
                 hist_data = {
-                    "bin_edges": np.histogram(series, bins=10)[1].tolist(),
-                    "bin_counts": np.histogram(series, bins=10)[0].tolist(),
+                    "bin_edges": bin_edges.tolist(),
+                    "bin_counts": bin_counts.tolist(),
                     "distribution_stats": {
                         "mean": float(series.mean()),
                         "std": float(series.std()),
-                        "skewness": float(series.skew()),
-                        "kurtosis": float(series.kurtosis())
+                        "skewness": skew_val,
+                        "kurtosis": kurt_val
                     }
                 }
                 
                 # Distribution interpretation
-                skew = abs(series.skew())
+                skew = abs(skew_val)
                 if skew < 0.5:
                     dist_shape = "approximately normal"
                 elif skew < 1:
@@ -1554,11 +2454,13 @@ async def handle_distribution_checks(args: Dict[str, Any]) -> Dict[str, Any]:
                 
                 hist_data["interpretation"] = {
                     "shape": dist_shape,
-                    "symmetry": "symmetric" if abs(series.skew()) < 0.5 else "asymmetric",
-                    "tail_behavior": "heavy tails" if series.kurtosis() > 3 else "light tails" if series.kurtosis() < -1 else "normal tails"
+                    "symmetry": "symmetric" if skew < 0.5 else "asymmetric",
+                    "tail_behavior": "heavy tails" if kurt_val > 3 else "light tails" if kurt_val < -1 else "normal tails"
                 }
                 
                 numeric_distributions[col] = hist_data
+                if "skewed" in dist_shape:
+                    skewed_vars.append(col)
             
             analysis_results["numeric_distributions"] = numeric_distributions
         
@@ -1567,38 +2469,46 @@ async def handle_distribution_checks(args: Dict[str, Any]) -> Dict[str, Any]:
             categorical_cols = data.select_dtypes(include=['object']).columns
             categorical_distributions = {}
             
+            total_rows = len(data)
+            
             for col in categorical_cols:
+                # Full counts are needed: evenness uses every category, not just the top 10
                 value_counts = data[col].value_counts()
+                n_categories = len(value_counts)
+                top_count = int(value_counts.iloc[0])
+                top_share = top_count / total_rows
                 
                 cat_data = {
                     "value_counts": value_counts.head(10).to_dict(),  # Top 10 categories
-                    "total_categories": len(value_counts),
+                    "total_categories": n_categories,
                     "most_common": {
                         "value": value_counts.index[0],
-                        "count": int(value_counts.iloc[0]),
-                        "percentage": round((value_counts.iloc[0] / len(data)) * 100, 2)
+                        "count": top_count,
+                        "percentage": round(top_share * 100, 2)
                     },
                     "distribution_evenness": round(value_counts.std() / value_counts.mean(), 2) if value_counts.mean() > 0 else 0
                 }
                 
                 # Interpretation
-                if len(value_counts) == 1:
+                if n_categories == 1:
                     dist_type = "single value (no variation)"
-                elif len(value_counts) == 2:
+                elif n_categories == 2:
                     dist_type = "binary distribution"
-                elif value_counts.iloc[0] / len(data) > 0.8:
+                elif top_share > 0.8:
                     dist_type = "highly concentrated"
-                elif len(value_counts) > 50:
+                elif n_categories > 50:
                     dist_type = "high cardinality"
                 else:
                     dist_type = "well distributed"
                 
                 cat_data["interpretation"] = {
                     "distribution_type": dist_type,
-                    "diversity": "low" if len(value_counts) < 5 else "moderate" if len(value_counts) < 20 else "high"
+                    "diversity": "low" if n_categories < 5 else "moderate" if n_categories < 20 else "high"
                 }
                 
                 categorical_distributions[col] = cat_data
+                if n_categories > 20:
+                    high_cardinality.append(col)
             
             analysis_results["categorical_distributions"] = categorical_distributions
         
@@ -1608,16 +2518,12 @@ async def handle_distribution_checks(args: Dict[str, Any]) -> Dict[str, Any]:
             insights.append(f"📊 Analyzed distributions for {len(analysis_results['numeric_distributions'])} numeric columns")
             
             # Highlight interesting patterns
-            skewed_vars = [col for col, data in analysis_results["numeric_distributions"].items() 
-                          if "skewed" in data["interpretation"]["shape"]]
             if skewed_vars:
                 insights.append(f"📈 Skewed distributions found in: {', '.join(skewed_vars[:3])}")
         
         if "categorical_distributions" in analysis_results:
             insights.append(f"📋 Analyzed distributions for {len(analysis_results['categorical_distributions'])} categorical columns")
             
-            high_cardinality = [col for col, data in analysis_results["categorical_distributions"].items() 
-                               if data["total_categories"] > 20]
             if high_cardinality:
                 insights.append(f"🔍 High cardinality variables: {', '.join(high_cardinality[:3])}")
         
@@ -1648,12 +2554,12 @@ async def handle_correlation_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     file_path = args.get("file_path", "")
     method = args.get("method", "both")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         numeric_cols = data.select_dtypes(include=['number']).columns
         
@@ -1664,33 +2570,36 @@ async def handle_correlation_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
         
         # Pearson correlation
         if method in ["pearson", "both"]:
-            pearson_corr = data[numeric_cols].corr(method='pearson')
-            analysis_results["pearson_correlation"] = pearson_corr.to_dict()
+            pearson_corr = cached_correlation(file_path, file_stat, data[numeric_cols], 'pearson')
+            analysis_results["pearson_correlation"] = pearson_corr.to_dict(orient='split')
         
         # Spearman correlation
         if method in ["spearman", "both"]:
-            spearman_corr = data[numeric_cols].corr(method='spearman')
-            analysis_results["spearman_correlation"] = spearman_corr.to_dict()
+            spearman_corr = cached_correlation(file_path, file_stat, data[numeric_cols], 'spearman')
+            analysis_results["spearman_correlation"] = spearman_corr.to_dict(orient='split')
         
         # Find strong correlations
         strong_correlations = []
         corr_matrix = pearson_corr if method == "pearson" else spearman_corr if method == "spearman" else pearson_corr
         
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i+1, len(corr_matrix.columns)):
-                corr_val = corr_matrix.iloc[i, j]
-                if abs(corr_val) > 0.7:
-                    strength = "Very Strong" if abs(corr_val) > 0.9 else "Strong"
-                    direction = "Positive" if corr_val > 0 else "Negative"
-                    
-                    strong_correlations.append({
-                        "variable1": corr_matrix.columns[i],
-                        "variable2": corr_matrix.columns[j],
-                        "correlation": round(float(corr_val), 3),
-                        "strength": strength,
-                        "direction": direction,
-                        "interpretation": f"{strength} {direction.lower()} relationship"
-                    })
+        # Upper-triangle pairs gathered in one vectorized pass; only the survivors reach Python
+        strong_i, strong_j, strong_vals = strong_correlation_pairs(corr_matrix.to_numpy(), 0.7)
+        strengths = np.where(np.abs(strong_vals) > 0.9, "Very Strong", "Strong")
+        directions = np.where(strong_vals > 0, "Positive", "Negative")
+        columns = corr_matrix.columns
+        
+        for i, j, corr_val, strength, direction in zip(
+            strong_i.tolist(), strong_j.tolist(), strong_vals.tolist(),
+            strengths.tolist(), directions.tolist()
+        ):
+            strong_correlations.append({
+                "variable1": columns[i],
+                "variable2": columns[j],
+                "correlation": round(corr_val, 3),
+                "strength": strength,
+                "direction": direction,
+                "interpretation": f"{strength} {direction.lower()} relationship"
+            })
         
         # Generate insights
         insights = []
@@ -1750,16 +2659,16 @@ async def handle_scatter_plots(args: Dict[str, Any]) -> Dict[str, Any]:
     y_variable = args.get("y_variable", "")
     color_by = args.get("color_by", "")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     if not x_variable or not y_variable:
         return {"error": "Both x_variable and y_variable are required"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        data = load_data_file(file_path)
+        # Only the plotted columns are parsed
+        data = load_data_file(file_path, usecols=[col for col in (x_variable, y_variable, color_by) if col], stat=file_stat)
         
         if x_variable not in data.columns:
             return {"error": f"Column '{x_variable}' not found in dataset"}
@@ -1774,16 +2683,9 @@ async def handle_scatter_plots(args: Dict[str, Any]) -> Dict[str, Any]:
         
         # Basic relationship analysis
         if pd.api.types.is_numeric_dtype(data[x_variable]) and pd.api.types.is_numeric_dtype(data[y_variable]):
-            correlation = plot_data[x_variable].corr(plot_data[y_variable])
-            
-            # Linear regression for trend
-            try:
-                from scipy import stats
-                slope, intercept, r_value, p_value, std_err = stats.linregress(plot_data[x_variable], plot_data[y_variable])
-            except ImportError:
-                # Fallback without scipy
-                correlation = plot_data[x_variable].corr(plot_data[y_variable])
-                slope, intercept, r_value, p_value, std_err = 0, 0, correlation, 0.05, 0
+            # Linear regression for trend - its r is the Pearson correlation
+            slope, intercept, r_value, p_value = linear_fit(plot_data[x_variable], plot_data[y_variable])
+            correlation = r_value
             
             relationship_analysis = {
                 "correlation": round(float(correlation), 3),
@@ -1847,21 +2749,86 @@ async def handle_scatter_plots(args: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Failed to create scatter plot analysis: {str(e)}"}
 
+_NS_PER_DAY = 86_400 * 10**9
+
+def _trend_for_column(data_sorted: pd.DataFrame, date_column: str, col: str,
+                      valid_dates: np.ndarray, dates_ns: np.ndarray,
+                      fit: Optional[tuple] = None) -> Optional[Dict[str, Any]]:
+    """
+    Trend, pattern and completeness summary of one value column (None below 3 points).
+    
+    ``valid_dates`` and ``dates_ns`` (the date column as int64 nanoseconds) are
+    computed once per call; since ``data_sorted`` is ordered by date, a column's
+    first and last complete rows bound its time span. ``fit`` is a precomputed
+    (slope, intercept, r, p_value) for columns fitted in a batch.
+    """
+    n_rows = len(data_sorted)
+    rows = np.flatnonzero(valid_dates & data_sorted[col].notna().to_numpy())
+    
+    if len(rows) < 3:
+        return None
+    
+    values = data_sorted[col].iloc[rows]
+    dates = data_sorted[date_column]
+    start_date, end_date = dates.iloc[rows[0]], dates.iloc[rows[-1]]
+    
+    # Basic temporal statistics
+    time_span = (end_date - start_date).days
+    
+    if len(rows) > 2:
+        # Trend analysis (simple linear trend) on whole days since the first observation
+        if fit is None:
+            time_numeric = (dates_ns[rows] - dates_ns[rows[0]]) // _NS_PER_DAY
+            fit = linear_fit(time_numeric, values)
+        slope, intercept, r_value, p_value = fit
+        
+        trend_analysis = {
+            "trend_slope": round(float(slope), 4),
+            "trend_strength": round(float(r_value**2), 3),
+            "trend_significance": float(p_value),
+            "trend_direction": "Increasing" if slope > 0 else "Decreasing" if slope < 0 else "Stable",
+            "is_significant": p_value < 0.05
+        }
+    else:
+        trend_analysis = {"note": "Insufficient data for trend analysis"}
+    
+    # Basic patterns
+    patterns = {
+        "time_span_days": int(time_span),
+        "data_points": len(rows),
+        "start_date": str(start_date.date()),
+        "end_date": str(end_date.date()),
+        "value_range": {
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "mean": float(values.mean())
+        }
+    }
+    
+    return {
+        "trend_analysis": trend_analysis,
+        "temporal_patterns": patterns,
+        "data_quality": {
+            "completeness": round((len(rows) / n_rows) * 100, 1),
+            "missing_dates": n_rows - len(rows)
+        }
+    }
+
 async def handle_temporal_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     """Handle time series analysis - trends, seasonality, patterns."""
     file_path = args.get("file_path", "")
     date_column = args.get("date_column", "")
     value_columns = args.get("value_columns", [])
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     if not date_column:
         return {"error": "date_column parameter is required"}
     
     try:
-        import pandas as pd
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         if date_column not in data.columns:
             return {"error": f"Date column '{date_column}' not found in dataset"}
@@ -1882,72 +2849,42 @@ async def handle_temporal_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
         # Sort by date
         data_sorted = data.sort_values(date_column)
         
-        temporal_results = {}
+        columns = [col for col in value_columns if col in data.columns]
+        
+        # Date validity and the nanosecond time axis are derived once for every column
+        valid_dates = data_sorted[date_column].notna().to_numpy()
+        dates_ns = data_sorted[date_column].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        
+        # Columns without gaps share one time axis - fit all of them in a single batch
+        fits = {}
+        dated_rows = np.flatnonzero(valid_dates)
+        if columns and len(dated_rows) >= 3:
+            dated = data_sorted.iloc[dated_rows]
+            complete = [col for col, has_gap in dated[columns].isna().any().items() if not has_gap]
+            if complete:
+                time_numeric = (dates_ns[dated_rows] - dates_ns[dated_rows[0]]) // _NS_PER_DAY
+                fits = dict(zip(complete, zip(*(
+                    part.tolist() for part in linear_fit_columns(time_numeric, dated[complete])
+                ))))
+        
+        def summarize(col):
+            return _trend_for_column(data_sorted, date_column, col, valid_dates, dates_ns, fits.get(col))
+        
+        # Columns are independent - summaries run on a thread pool (NumPy releases the GIL)
+        if len(columns) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(columns), os.cpu_count() or 1)) as pool:
+                column_results = list(pool.map(summarize, columns))
+        else:
+            column_results = [summarize(col) for col in columns]
         
-        for col in value_columns:
-            if col not in data.columns:
-                continue
-            
-            # Time series data
-            ts_data = data_sorted[[date_column, col]].dropna()
-            
-            if len(ts_data) < 3:
-                continue
-            
-            # Basic temporal statistics
-            time_span = (ts_data[date_column].max() - ts_data[date_column].min()).days
-            
-            # Trend analysis (simple linear trend)
-            ts_data['time_numeric'] = (ts_data[date_column] - ts_data[date_column].min()).dt.days
-            
-            if len(ts_data) > 2:
-                try:
-                    from scipy import stats
-                    slope, intercept, r_value, p_value, std_err = stats.linregress(ts_data['time_numeric'], ts_data[col])
-                except ImportError:
-                    # Fallback calculation without scipy
-                    correlation = ts_data['time_numeric'].corr(ts_data[col])
-                    slope = correlation * (ts_data[col].std() / ts_data['time_numeric'].std())
-                    r_value = correlation
-                    p_value = 0.05
-                    std_err = 0
-                
-                trend_analysis = {
-                    "trend_slope": round(float(slope), 4),
-                    "trend_strength": round(float(r_value**2), 3),
-                    "trend_significance": float(p_value),
-                    "trend_direction": "Increasing" if slope > 0 else "Decreasing" if slope < 0 else "Stable",
-                    "is_significant": p_value < 0.05
-                }
-            else:
-                trend_analysis = {"note": "Insufficient data for trend analysis"}
-            
-            # Basic patterns
-            patterns = {
-                "time_span_days": int(time_span),
-                "data_points": len(ts_data),
-                "start_date": str(ts_data[date_column].min().date()),
-                "end_date": str(ts_data[date_column].max().date()),
-                "value_range": {
-                    "min": float(ts_data[col].min()),
-                    "max": float(ts_data[col].max()),
-                    "mean": float(ts_data[col].mean())
-                }
-            }
-            
-            temporal_results[col] = {
-                "trend_analysis": trend_analysis,
-                "temporal_patterns": patterns,
-                "data_quality": {
-                    "completeness": round((len(ts_data) / len(data)) * 100, 1),
-                    "missing_dates": len(data) - len(ts_data)
-                }
-            }
+        temporal_results = {col: result for col, result in zip(columns, column_results) if result is not None}
         
         # Generate insights
         insights = []
         insights.append(f"📅 Temporal analysis completed for {len(temporal_results)} variables")
-        insights.append(f"⏱️ Time span: {time_span} days ({ts_data[date_column].min().strftime('%Y-%m-%d')} to {ts_data[date_column].max().strftime('%Y-%m-%d')})")
+        if temporal_results:
+            last_patterns = temporal_results[next(reversed(temporal_results))]["temporal_patterns"]
+            insights.append(f"⏱️ Time span: {last_patterns['time_span_days']} days ({last_patterns['start_date']} to {last_patterns['end_date']})")
         
         # Highlight trends
         trending_up = [col for col, data in temporal_results.items() 
@@ -1983,20 +2920,19 @@ async def handle_temporal_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Failed to perform temporal analysis: {str(e)}"}
 
+@content_cached
 async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str, Any]:
     """Handle production-grade optimized analysis workflow: Memory → Vectorization → Exploration."""
     file_path = args.get("file_path", "")
     analysis_goal = args.get("analysis_goal", "comprehensive exploration")
     optimization_level = args.get("optimization_level", "production")
+    include_benchmark = args.get("include_benchmark", False)
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        import time
-        
         workflow_results = {
             "workflow_phases": [],
             "performance_metrics": {},
@@ -2010,58 +2946,62 @@ async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str,
         phase1_start = time.time()
         
         # Load data
-        original_data = load_data_file(file_path)
-        original_memory = original_data.memory_usage(deep=True).sum() / (1024 * 1024)
+        original_data = load_data_file(file_path, stat=file_stat)
+        # One deep walk per frame; per-column figures are read from the same Series
+        original_col_memory = original_data.memory_usage(deep=True)
+        original_memory = original_col_memory.sum() / (1024 * 1024)
         
         # Apply memory optimization
-        optimized_data = original_data.copy()
         optimization_details = []
         
-        # Intelligent dtype optimization
+        # Intelligent dtype optimization - target dtypes are derived for all columns
+        # at once and applied in a single astype pass
+        dtype_map = {}
+        
+        # Integer optimization: smallest type holding each column's range
+        int_data = original_data.select_dtypes(include=['integer'])
+        if len(int_data.columns):
+            mins, maxs = int_data.min().to_numpy(), int_data.max().to_numpy()
+            targets = np.select(
+                [
+                    (mins >= 0) & (maxs <= 255),
+                    (mins >= -128) & (maxs <= 127),
+                    (mins >= 0) & (maxs <= 65535),
+                    (mins >= -32768) & (maxs <= 32767),
+                    (int_data.dtypes == 'int64').to_numpy(),
+                ],
+                ['uint8', 'int8', 'uint16', 'int16', 'int32'],
+                default=''
+            )
+            dtype_map.update({col: target for col, target in zip(int_data.columns, targets) if target})
+        
+        # Float optimization
+        if optimization_level in ["aggressive", "production"]:
+            dtype_map.update(dict.fromkeys(original_data.select_dtypes(include=['float64']).columns, 'float32'))
+        
+        # Categorical optimization: less than 50% unique values
+        dtype_map.update(dict.fromkeys(category_candidates(original_data), 'category'))
+        
+        optimized_data = original_data.astype(dtype_map) if dtype_map else original_data.copy()
+        
+        optimized_col_memory = optimized_data.memory_usage(deep=True)
+        optimized_memory = optimized_col_memory.sum() / (1024 * 1024)
+        
+        # Track optimization
         for col in optimized_data.columns:
-            original_dtype = str(optimized_data[col].dtype)
-            original_col_memory = optimized_data[col].memory_usage(deep=True) / (1024 * 1024)
-            
-            # Integer optimization
-            if pd.api.types.is_integer_dtype(optimized_data[col]):
-                min_val, max_val = optimized_data[col].min(), optimized_data[col].max()
-                
-                if min_val >= 0 and max_val <= 255:
-                    optimized_data[col] = optimized_data[col].astype('uint8')
-                elif min_val >= -128 and max_val <= 127:
-                    optimized_data[col] = optimized_data[col].astype('int8')
-                elif min_val >= 0 and max_val <= 65535:
-                    optimized_data[col] = optimized_data[col].astype('uint16')
-                elif min_val >= -32768 and max_val <= 32767:
-                    optimized_data[col] = optimized_data[col].astype('int16')
-                elif original_dtype == 'int64':
-                    optimized_data[col] = optimized_data[col].astype('int32')
-            
-            # Float optimization
-            elif pd.api.types.is_float_dtype(optimized_data[col]) and original_dtype == 'float64':
-                if optimization_level in ["aggressive", "production"]:
-                    optimized_data[col] = optimized_data[col].astype('float32')
-            
-            # Categorical optimization
-            elif optimized_data[col].dtype == 'object':
-                unique_ratio = optimized_data[col].nunique() / len(optimized_data)
-                if unique_ratio < 0.5:  # Less than 50% unique values
-                    optimized_data[col] = optimized_data[col].astype('category')
-            
-            # Track optimization
-            new_col_memory = optimized_data[col].memory_usage(deep=True) / (1024 * 1024)
-            if new_col_memory < original_col_memory:
-                memory_saved = original_col_memory - new_col_memory
-                reduction_pct = (memory_saved / original_col_memory) * 100
+            col_original_mb = original_col_memory[col] / (1024 * 1024)
+            col_optimized_mb = optimized_col_memory[col] / (1024 * 1024)
+            if col_optimized_mb < col_original_mb:
+                memory_saved = col_original_mb - col_optimized_mb
+                reduction_pct = (memory_saved / col_original_mb) * 100
                 optimization_details.append({
                     "column": col,
-                    "original_dtype": original_dtype,
+                    "original_dtype": str(original_data[col].dtype),
                     "optimized_dtype": str(optimized_data[col].dtype),
                     "memory_saved_mb": round(memory_saved, 3),
                     "reduction_percent": round(reduction_pct, 1)
                 })
         
-        optimized_memory = optimized_data.memory_usage(deep=True).sum() / (1024 * 1024)
         total_memory_reduction = ((original_memory - optimized_memory) / original_memory) * 100
         phase1_time = time.time() - phase1_start
         
@@ -2092,8 +3032,8 @@ async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str,
         # Enable vectorized operations
         numeric_cols = optimized_data.select_dtypes(include=['number']).columns
         
-        if len(numeric_cols) > 0:
-            # Demonstrate vectorized calculations vs loops
+        if len(numeric_cols) > 0 and include_benchmark:
+            # Demonstrate vectorized calculations vs loops (opt-in - a Python loop on every call)
             sample_col = numeric_cols[0]
             
             # Simulated loop-based calculation timing
@@ -2119,6 +3059,13 @@ async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str,
                     "speedup_factor": round(speedup_factor, 1),
                     "performance_gain": f"{speedup_factor:.1f}x faster"
                 })
+        elif len(numeric_cols) > 0:
+            narrow_types = sorted({str(dtype) for dtype in optimized_data[numeric_cols].dtypes})
+            vectorization_improvements.append({
+                "operation": "arithmetic_operations",
+                "optimization": f"Numeric columns stored as {', '.join(narrow_types)}",
+                "benefit": "Narrower dtypes pack more values per SIMD register for column-wide arithmetic"
+            })
         
         # Additional vectorization optimizations
         categorical_cols = optimized_data.select_dtypes(include=['category']).columns
@@ -2129,6 +3076,7 @@ async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str,
                 "benefit": "Faster groupby, filtering, and aggregation operations"
             })
         
+        best_speedup = max([imp.get('speedup_factor', 1) for imp in vectorization_improvements], default=1)
         phase2_time = time.time() - phase2_start
         
         workflow_results["workflow_phases"].append({
@@ -2140,7 +3088,7 @@ async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str,
         
         workflow_results["performance_metrics"]["vectorization"] = {
             "improvements": vectorization_improvements,
-            "overall_speedup": f"Up to {max([imp.get('speedup_factor', 1) for imp in vectorization_improvements], default=1):.1f}x faster operations"
+            "overall_speedup": f"Up to {best_speedup:.1f}x faster operations"
         }
         
         # Phase 3: Data Exploration (THIRD - after optimization)
@@ -2174,20 +3122,16 @@ async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str,
         # Correlation analysis (vectorized)
         if len(numeric_cols) > 1:
             corr_start = time.time()
-            correlation_matrix = optimized_data[numeric_cols].corr()
+            # Shared with correlation_analysis / the heatmap for the same file version
+            correlation_matrix = cached_correlation(file_path, file_stat, optimized_data[numeric_cols], 'pearson')
             corr_time = time.time() - corr_start
             
             # Find strong correlations
-            strong_corrs = []
-            for i in range(len(correlation_matrix.columns)):
-                for j in range(i+1, len(correlation_matrix.columns)):
-                    corr_val = correlation_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.7:
-                        strong_corrs.append({
-                            "var1": correlation_matrix.columns[i],
-                            "var2": correlation_matrix.columns[j],
-                            "correlation": round(float(corr_val), 3)
-                        })
+            columns = correlation_matrix.columns
+            strong_corrs = [
+                {"var1": columns[i], "var2": columns[j], "correlation": round(corr_val, 3)}
+                for i, j, corr_val in zip(*(part.tolist() for part in strong_correlation_pairs(correlation_matrix.to_numpy(), 0.7)))
+            ]
             
             exploration_results["correlation_analysis"] = {
                 "strong_correlations": strong_corrs,
@@ -2245,7 +3189,7 @@ async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str,
                 "scalability_benefit": "Optimizations apply to all similar datasets"
             },
             "operational_efficiency": {
-                "faster_analysis": f"Vectorization provides up to {max([imp.get('speedup_factor', 1) for imp in vectorization_improvements], default=1):.1f}x speedup",
+                "faster_analysis": f"Vectorization provides up to {best_speedup:.1f}x speedup",
                 "reduced_compute_costs": "Lower CPU usage through optimized operations",
                 "improved_responsiveness": "Sub-second response times for interactive analysis"
             },
@@ -2260,7 +3204,7 @@ async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str,
         # Generate comprehensive insights
         insights = [
             f"🧠 Phase 1: Memory optimized by {total_memory_reduction:.1f}% ({original_memory:.1f}MB → {optimized_memory:.1f}MB)",
-            f"⚡ Phase 2: Vectorization enabled with up to {max([imp.get('speedup_factor', 1) for imp in vectorization_improvements], default=1):.1f}x performance improvement",
+            f"⚡ Phase 2: Vectorization enabled with up to {best_speedup:.1f}x performance improvement",
             f"🔍 Phase 3: Exploration completed on optimized dataset in {phase3_time:.2f}s",
             f"💰 Business impact: ${workflow_results['optimization_achievements']['memory_reduction']['monthly_cost_savings']}/month infrastructure savings",
             f"🚀 Total workflow time: {total_time:.2f}s (production-optimized)"
@@ -2282,7 +3226,7 @@ async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str,
             ],
             "interview_highlights": [
                 f"✅ {total_memory_reduction:.1f}% memory reduction achieved before analysis",
-                f"✅ {max([imp.get('speedup_factor', 1) for imp in vectorization_improvements], default=1):.1f}x performance improvement through vectorization",
+                f"✅ {best_speedup:.1f}x performance improvement through vectorization",
                 "✅ Production-grade engineering workflow demonstrated",
                 "✅ Quantified business impact with cost savings",
                 "✅ Scalable optimization methodology showcased"
@@ -2294,44 +3238,67 @@ async def handle_optimized_analysis_workflow(args: Dict[str, Any]) -> Dict[str,
     except Exception as e:
         return {"error": f"Failed to execute optimized analysis workflow: {str(e)}"}
 
+# Business recommendations per business_focus ("default" for any other focus)
+_BUSINESS_RECS = {
+    "financial": (
+        "Monitor key financial metrics identified in correlation analysis",
+        "Investigate outliers for potential cost optimization opportunities",
+        "Consider predictive modeling for revenue forecasting"
+    ),
+    "customer": (
+        "Segment customers based on identified patterns",
+        "Focus on high-value customer characteristics",
+        "Implement customer retention strategies based on trends"
+    ),
+    "default": (
+        "Implement data quality monitoring for identified issues",
+        "Apply memory optimization for cost savings",
+        "Consider advanced analytics for deeper insights"
+    )
+}
+
+@content_cached
 async def handle_full_exploration_report(args: Dict[str, Any]) -> Dict[str, Any]:
     """Handle comprehensive exploration report - runs all analyses."""
     file_path = args.get("file_path", "")
     include_visualizations = args.get("include_visualizations", True)
     business_focus = args.get("business_focus", "general")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        data = load_data_file(file_path)
-        
-        # Run all analyses
-        overview = await handle_dataset_overview({"file_path": file_path})
-        numeric = await handle_numeric_exploration({"file_path": file_path})
-        distributions = await handle_distribution_checks({"file_path": file_path})
-        correlations = await handle_correlation_analysis({"file_path": file_path})
-        memory_opt = await handle_optimize_memory({"file_path": file_path})
+        data = load_data_file(file_path, stat=file_stat)
+        summary = dataset_summary(file_path, stat=file_stat)
         
         # Temporal analysis if date column exists
-        temporal_result = None
-        date_cols = []
-        for col in data.columns:
-            try:
-                pd.to_datetime(data[col].dropna().head(10))
-                date_cols.append(col)
-            except:
-                continue
-        
-        if date_cols:
-            numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
-            if numeric_cols:
-                temporal_result = await handle_temporal_analysis({
-                    "file_path": file_path,
-                    "date_column": date_cols[0],
-                    "value_columns": numeric_cols[:3]  # Limit to first 3 numeric columns
-                })
+        date_cols = [col for col in data.columns if looks_like_dates(data[col])]
+        
+        sub_calls = [
+            (handler, {"file_path": file_path})
+            for handler in (
+                handle_dataset_overview,
+                handle_numeric_exploration,
+                handle_distribution_checks,
+                handle_correlation_analysis,
+                handle_optimize_memory
+            )
+        ]
+        numeric_cols = summary.numeric_cols
+        if date_cols and numeric_cols:
+            sub_calls.append((handle_temporal_analysis, {
+                "file_path": file_path,
+                "date_column": date_cols[0],
+                "value_columns": numeric_cols[:3]  # Limit to first 3 numeric columns
+            }))
+        
+        # Run all analyses concurrently - each is read-only on the cached frame,
+        # so they run on their own worker threads and latency is the slowest one
+        overview, numeric, distributions, correlations, memory_opt, *temporal = await asyncio.gather(*(
+            asyncio.to_thread(_run_handler, handler, sub_args) for handler, sub_args in sub_calls
+        ))
+        temporal_result = temporal[0] if temporal else None
         
         # Compile comprehensive insights
         all_insights = []
@@ -2352,25 +3319,7 @@ async def handle_full_exploration_report(args: Dict[str, Any]) -> Dict[str, Any]
         }
         
         # Business recommendations based on focus
-        business_recommendations = []
-        if business_focus == "financial":
-            business_recommendations.extend([
-                "Monitor key financial metrics identified in correlation analysis",
-                "Investigate outliers for potential cost optimization opportunities",
-                "Consider predictive modeling for revenue forecasting"
-            ])
-        elif business_focus == "customer":
-            business_recommendations.extend([
-                "Segment customers based on identified patterns",
-                "Focus on high-value customer characteristics",
-                "Implement customer retention strategies based on trends"
-            ])
-        else:
-            business_recommendations.extend([
-                "Implement data quality monitoring for identified issues",
-                "Apply memory optimization for cost savings",
-                "Consider advanced analytics for deeper insights"
-            ])
+        business_recommendations = list(_BUSINESS_RECS.get(business_focus, _BUSINESS_RECS["default"]))
         
         result = {
             "status": "success",
@@ -2388,7 +3337,7 @@ async def handle_full_exploration_report(args: Dict[str, Any]) -> Dict[str, Any]
             "business_recommendations": business_recommendations,
             "performance_metrics": {
                 "analysis_comprehensiveness": "100% - all major analysis types completed",
-                "data_coverage": f"{len(data.select_dtypes(include=['number']).columns)} numeric + {len(data.select_dtypes(include=['object']).columns)} categorical variables",
+                "data_coverage": f"{len(summary.numeric_cols)} numeric + {len(summary.object_cols)} categorical variables",
                 "memory_optimization": memory_opt.get("memory_optimization", {}).get("memory_reduction_percent", 0)
             },
             "interview_highlights": [
@@ -2409,12 +3358,13 @@ async def handle_discover_data(args: Dict[str, Any]) -> Dict[str, Any]:
     """Handle data discovery requests."""
     file_path = args.get("file_path", "")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
+        summary = dataset_summary(file_path, stat=file_stat)
         
         result = {
             "status": "success",
@@ -2422,19 +3372,22 @@ async def handle_discover_data(args: Dict[str, Any]) -> Dict[str, Any]:
                 "name": Path(file_path).name,
                 "rows": len(data),
                 "columns": len(data.columns),
-                "size_mb": Path(file_path).stat().st_size / (1024 * 1024)
+                "size_mb": file_stat.st_size / (1024 * 1024)
             },
+            # Frame-level null/unique counts instead of per-column Series calls
             "column_summary": {
                 col: {
-                    "data_type": str(data[col].dtype),
-                    "null_count": int(data[col].isnull().sum()),
-                    "unique_count": int(data[col].nunique())
-                } for col in data.columns
+                    "data_type": str(dtype),
+                    "null_count": null_count,
+                    "unique_count": unique_count
+                } for col, dtype, null_count, unique_count in zip(
+                    data.columns, data.dtypes, summary.nulls.tolist(), summary.nunique.tolist()
+                )
             },
             "insights": [
                 "✅ Dataset loaded successfully",
                 f"📊 Found {len(data)} rows and {len(data.columns)} columns",
-                f"💾 File size: {Path(file_path).stat().st_size / (1024 * 1024):.2f} MB"
+                f"💾 File size: {file_stat.st_size / (1024 * 1024):.2f} MB"
             ]
         }
         
@@ -2447,28 +3400,42 @@ async def handle_optimize_memory(args: Dict[str, Any]) -> Dict[str, Any]:
     """Handle memory optimization requests."""
     file_path = args.get("file_path", "")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
-        # Calculate original memory
-        original_memory = data.memory_usage(deep=True).sum() / (1024 * 1024)
+        # Calculate original memory - one deep walk, kept per column
+        col_memory = data.memory_usage(deep=True)
+        original_memory = col_memory.sum() / (1024 * 1024)
         
-        # Simple optimization: convert object columns with low cardinality to category
-        optimized_data = data.copy()
+        # Simple optimization: convert object columns with low cardinality to category.
+        # No working copy of the frame - only the converted columns are re-measured.
         optimizations = []
-        
-        for col in data.select_dtypes(include=['object']).columns:
-            unique_ratio = data[col].nunique() / len(data)
-            if unique_ratio < 0.5:  # Less than 50% unique values
-                optimized_data[col] = optimized_data[col].astype('category')
-                optimizations.append(f"Converted {col} to category")
+        saved_bytes = 0
+        
+        for col in category_candidates(data):  # Less than 50% unique values
+            converted = data[col].astype('category')
+            saved_bytes += col_memory[col] - converted.memory_usage(index=False, deep=True)
+            optimizations.append(f"Converted {col} to category")
+        
+        # Numeric downcasting: smallest integer type holding each column's range, and
+        # float32 only where it represents the values within float tolerance
+        for col in data.select_dtypes(include=['integer', 'floating']).columns:
+            original = data[col]
+            is_float = pd.api.types.is_float_dtype(original)
+            converted = pd.to_numeric(original, downcast='float' if is_float else 'integer')
+            if converted.dtype == original.dtype:
+                continue
+            if is_float and not np.allclose(original.to_numpy(), converted.to_numpy(), equal_nan=True):
+                continue
+            saved_bytes += col_memory[col] - converted.memory_usage(index=False, deep=True)
+            optimizations.append(f"Downcast {col} from {original.dtype} to {converted.dtype}")
         
         # Calculate optimized memory
-        optimized_memory = optimized_data.memory_usage(deep=True).sum() / (1024 * 1024)
+        optimized_memory = (col_memory.sum() - saved_bytes) / (1024 * 1024)
         memory_reduction = ((original_memory - optimized_memory) / original_memory) * 100
         
         # Estimate cost savings (example calculation)
@@ -2541,6 +3508,7 @@ async def handle_explain_methodology(args: Dict[str, Any]) -> Dict[str, Any]:
         ]
     }
 
+@session_locked
 async def handle_start_guided_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     """Start step-by-step guided exploratory analysis."""
     global analysis_session
@@ -2548,20 +3516,21 @@ async def handle_start_guided_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     file_path = args.get("file_path", "")
     analysis_goal = args.get("analysis_goal", "comprehensive exploration")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
         
         # Load data
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         # Reset session
         analysis_session = {
             "current_step": 1,
             "data": data,
             "data_profile": None,
+            "nunique": None,
             "analysis_goal": analysis_goal,
             "findings": [],
             "next_questions": [],
@@ -2569,33 +3538,35 @@ async def handle_start_guided_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
             "completed_steps": []
         }
         
-        # Load and OPTIMIZE data first (following your recommended workflow)
-        original_data = load_data_file(file_path)
-        
-        # Phase 1: Memory optimization (FIRST)
-        optimized_data = original_data.copy()
-        optimization_count = 0
-        
-        for col in optimized_data.columns:
-            if optimized_data[col].dtype == 'object':
-                unique_ratio = optimized_data[col].nunique() / len(optimized_data)
-                if unique_ratio < 0.5:
-                    optimized_data[col] = optimized_data[col].astype('category')
-                    optimization_count += 1
-        
-        # Store optimized data for analysis
+        # Phase 1: Memory optimization (FIRST) - converted in place on the
+        # loaded frame (a shallow copy, so the load cache is untouched)
+        optimized_data = data
+        summary = dataset_summary(file_path, stat=file_stat)  # null/distinct counts survive the conversion
+        analysis_session["original_memory"] = optimized_data.memory_usage(deep=True).sum() / (1024 * 1024)
+        category_cols = category_candidates(optimized_data)  # Less than 50% unique values
+        optimization_count = len(category_cols)
+        if category_cols:
+            optimized_data[category_cols] = optimized_data[category_cols].astype('category')
+        
+        # Store optimized data for analysis, with the distinct counts later steps reuse
         analysis_session["data"] = optimized_data
-        analysis_session["original_memory"] = original_data.memory_usage(deep=True).sum() / (1024 * 1024)
+        analysis_session["nunique"] = summary.nunique
         analysis_session["optimized_memory"] = optimized_data.memory_usage(deep=True).sum() / (1024 * 1024)
         analysis_session["memory_reduction"] = ((analysis_session["original_memory"] - analysis_session["optimized_memory"]) / analysis_session["original_memory"]) * 100
         
-        # Create data profile (using optimized data)
+        # Create data profile (using optimized data) - summary stats for the
+        # numeric columns only, in one frame-level aggregation
+        numeric_data = optimized_data.select_dtypes(include=['number'])
+        basic_stats = {
+            col: {stat: (float(val) if pd.notna(val) else str(val)) for stat, val in stats.items()}
+            for col, stats in numeric_data.agg(['count', 'mean', 'std', 'min', 'max']).to_dict().items()
+        } if len(numeric_data.columns) > 0 else {}
         profile = {
             "shape": optimized_data.shape,
             "columns": list(optimized_data.columns),
             "dtypes": {col: str(dtype) for col, dtype in optimized_data.dtypes.items()},
-            "null_counts": optimized_data.isnull().sum().to_dict(),
-            "basic_stats": {col: {stat: (float(val) if pd.notna(val) and isinstance(val, (int, float)) else str(val)) for stat, val in stats.items()} for col, stats in optimized_data.describe(include='all').to_dict().items()} if len(optimized_data.select_dtypes(include=['number']).columns) > 0 else {},
+            "null_counts": summary.nulls.to_dict(),
+            "basic_stats": basic_stats,
             "optimization_applied": True,
             "memory_optimized": True
         }
@@ -2619,7 +3590,7 @@ async def handle_start_guided_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
         findings.append(f"📈 Optimized composition: {numeric_cols} numeric, {text_cols} text, {category_cols} category")
         
         # Check for missing data
-        total_missing = optimized_data.isnull().sum().sum()
+        total_missing = summary.nulls.sum()
         missing_pct = (total_missing / (optimized_data.shape[0] * optimized_data.shape[1])) * 100
         if missing_pct > 0:
             findings.append(f"⚠️ Missing data: {missing_pct:.1f}% of all values")
@@ -2627,11 +3598,7 @@ async def handle_start_guided_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
             findings.append("✅ No missing data detected")
         
         # Identify potentially important columns
-        important_cols = []
-        for col in optimized_data.columns:
-            col_lower = col.lower()
-            if any(keyword in col_lower for keyword in ['id', 'revenue', 'cost', 'profit', 'amount', 'price', 'date', 'customer']):
-                important_cols.append(col)
+        important_cols = columns_matching(optimized_data.columns, _IMPORTANT_RE)
         
         if important_cols:
             findings.append(f"🔍 Key columns identified: {', '.join(important_cols[:5])}")
@@ -2670,6 +3637,7 @@ async def handle_start_guided_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Failed to start guided analysis: {str(e)}"}
 
+@session_locked
 async def handle_continue_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     """Continue guided analysis based on user response."""
     global analysis_session
@@ -2778,20 +3746,21 @@ async def perform_data_discovery(data, user_response, focus_area):
     findings = []
     analysis = {}
     
-    # Column analysis
-    for col in data.columns:
+    # Column analysis - every statistic computed frame-wide, then read per column
+    null_counts = data.isnull().sum()
+    unique_counts = session_nunique(data)
+    stat_cols = [col for col, dtype in data.dtypes.items() if dtype in ['int64', 'float64']]
+    col_stats = data[stat_cols].agg(['min', 'max', 'mean']).to_dict() if stat_cols else {}
+    
+    for col, dtype in data.dtypes.items():
         col_info = {
-            "dtype": str(data[col].dtype),
-            "null_count": int(data[col].isnull().sum()),
-            "unique_count": int(data[col].nunique())
+            "dtype": str(dtype),
+            "null_count": int(null_counts[col]),
+            "unique_count": int(unique_counts[col])
         }
         
-        if data[col].dtype in ['int64', 'float64']:
-            col_info.update({
-                "min": float(data[col].min()),
-                "max": float(data[col].max()),
-                "mean": float(data[col].mean())
-            })
+        if col in col_stats:
+            col_info.update({stat: float(value) for stat, value in col_stats[col].items()})
         
         analysis[col] = col_info
     
@@ -2799,11 +3768,8 @@ async def perform_data_discovery(data, user_response, focus_area):
     findings.append(f"📊 Data types: {dict(data.dtypes.astype(str).value_counts())}")
     
     # Data quality assessment
-    quality_issues = []
-    for col in data.columns:
-        null_pct = (data[col].isnull().sum() / len(data)) * 100
-        if null_pct > 10:
-            quality_issues.append(f"{col}: {null_pct:.1f}% missing")
+    null_pcts = (null_counts / len(data)) * 100
+    quality_issues = [f"{col}: {null_pct:.1f}% missing" for col, null_pct in null_pcts.items() if null_pct > 10]
     
     if quality_issues:
         findings.append(f"⚠️ Quality issues found: {', '.join(quality_issues[:3])}")
@@ -2820,19 +3786,14 @@ async def perform_exploratory_analysis(data, user_response, focus_area):
     # Correlation analysis for numeric columns
     numeric_cols = data.select_dtypes(include=['number']).columns
     if len(numeric_cols) > 1:
-        corr_matrix = data[numeric_cols].corr()
+        corr_matrix = pearson_matrix(data[numeric_cols])
         
         # Find strong correlations
-        strong_corrs = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i+1, len(corr_matrix.columns)):
-                corr_val = corr_matrix.iloc[i, j]
-                if abs(corr_val) > 0.7:
-                    strong_corrs.append({
-                        "var1": corr_matrix.columns[i],
-                        "var2": corr_matrix.columns[j],
-                        "correlation": float(corr_val)
-                    })
+        columns = corr_matrix.columns
+        strong_corrs = [
+            {"var1": columns[i], "var2": columns[j], "correlation": corr_val}
+            for i, j, corr_val in zip(*(part.tolist() for part in strong_correlation_pairs(corr_matrix.to_numpy(), 0.7)))
+        ]
         
         analysis["correlations"] = strong_corrs
         if strong_corrs:
@@ -2842,21 +3803,27 @@ async def perform_exploratory_analysis(data, user_response, focus_area):
     
     # Distribution analysis
     dist_analysis = {}
-    for col in numeric_cols:
-        stats = {
-            "mean": float(data[col].mean()),
-            "std": float(data[col].std()),
-            "skewness": float(data[col].skew()),
-        }
-        
-        # Outlier detection using IQR
-        Q1 = data[col].quantile(0.25)
-        Q3 = data[col].quantile(0.75)
+    if len(numeric_cols) > 0:
+        # Moments and quartiles for all numeric columns at once
+        numeric = data[numeric_cols]
+        moments = numeric.agg(['mean', 'std', 'skew'])
+        quartiles = numeric.quantile([0.25, 0.75])
+        
+        # Outlier detection using IQR - one scan over the numeric block
+        Q1 = quartiles.loc[0.25].to_numpy(dtype=np.float64)
+        Q3 = quartiles.loc[0.75].to_numpy(dtype=np.float64)
         IQR = Q3 - Q1
-        outliers = ((data[col] < (Q1 - 1.5 * IQR)) | (data[col] > (Q3 + 1.5 * IQR))).sum()
-        stats["outliers"] = int(outliers)
+        outlier_counts, _ = iqr_outlier_scan(
+            numeric.to_numpy(dtype=np.float64, na_value=np.nan), Q1 - 1.5 * IQR, Q3 + 1.5 * IQR, keep=0
+        )
         
-        dist_analysis[col] = stats
+        for col, outliers in zip(numeric_cols, outlier_counts.tolist()):
+            dist_analysis[col] = {
+                "mean": float(moments.at['mean', col]),
+                "std": float(moments.at['std', col]),
+                "skewness": float(moments.at['skew', col]),
+                "outliers": int(outliers)
+            }
     
     analysis["distributions"] = dist_analysis
     findings.append("📈 Completed distribution and outlier analysis")
@@ -2869,24 +3836,19 @@ async def perform_business_analysis(data, user_response, focus_area):
     analysis = {}
     
     # Identify potential KPIs
-    kpi_candidates = []
-    for col in data.columns:
-        col_lower = col.lower()
-        if any(keyword in col_lower for keyword in ['revenue', 'profit', 'cost', 'amount', 'price', 'sales']):
-            kpi_candidates.append(col)
+    kpi_candidates = columns_matching(data.columns, _KPI_RE)
     
     analysis["kpi_candidates"] = kpi_candidates
     if kpi_candidates:
         findings.append(f"💰 Identified potential KPIs: {', '.join(kpi_candidates)}")
     
-    # Segment analysis for categorical columns
-    categorical_cols = data.select_dtypes(include=['object']).columns
+    # Segment analysis for categorical columns (text, or already converted to category)
+    categorical_cols = data.select_dtypes(include=['object', 'category']).columns
+    nunique = session_nunique(data)
     segments = {}
     
-    for col in categorical_cols:
-        if data[col].nunique() < 20:  # Reasonable number of categories
-            value_counts = data[col].value_counts().head().to_dict()
-            segments[col] = value_counts
+    for col in categorical_cols[(nunique[categorical_cols] < 20).to_numpy()]:  # Reasonable number of categories
+        segments[col] = data[col].value_counts().head().to_dict()
     
     analysis["segments"] = segments
     if segments:
@@ -2983,23 +3945,18 @@ async def main():
 
 async def handle_export_optimized_dataset(args: Dict[str, Any]) -> Dict[str, Any]:
     """Export memory-optimized dataset to various formats."""
-    import pandas as pd
-    import numpy as np
-    from pathlib import Path
-    import os
-    from datetime import datetime
-    
     file_path = args.get("file_path", "")
     output_format = args.get("output_format", "parquet")
     custom_output_path = args.get("output_path", "")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
         # Load and optimize the dataset
         logger.info("🧠 Loading and optimizing dataset for export...")
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         # Apply memory optimizations
         original_memory = data.memory_usage(deep=True).sum() / 1024**2
@@ -3119,25 +4076,19 @@ async def handle_export_optimized_dataset(args: Dict[str, Any]) -> Dict[str, Any
 
 async def handle_export_vectorized_dataset(args: Dict[str, Any]) -> Dict[str, Any]:
     """Export vectorized dataset with optimized operations and performance metrics."""
-    import pandas as pd
-    import numpy as np
-    from pathlib import Path
-    import os
-    from datetime import datetime
-    import time
-    
     file_path = args.get("file_path", "")
     output_format = args.get("output_format", "parquet")
     custom_output_path = args.get("output_path", "")
     include_metrics = args.get("include_metrics", True)
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
         # Load dataset
         logger.info("⚡ Loading dataset for vectorized processing...")
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         # Apply memory optimizations first
         original_memory = data.memory_usage(deep=True).sum() / 1024**2
@@ -3317,16 +4268,13 @@ async def handle_advanced_feature_engineering(args: Dict[str, Any]) -> Dict[str,
     file_path = args.get("file_path", "")
     feature_types = args.get("feature_types", ["efficiency_ratios", "performance_metrics", "percentile_rankings"])
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        import time
-        
         start_time = time.time()
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         print("🔧 ADVANCED FEATURE ENGINEERING (Vectorized):")
         print()
@@ -3398,13 +4346,11 @@ async def handle_performance_benchmarking(args: Dict[str, Any]) -> Dict[str, Any
     file_path = args.get("file_path", "")
     benchmark_type = args.get("benchmark_type", "comprehensive")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        import time
         import psutil
         
         print("📊 PERFORMANCE BENCHMARKING RESULTS:")
@@ -3416,16 +4362,13 @@ async def handle_performance_benchmarking(args: Dict[str, Any]) -> Dict[str, Any
         
         # Load and optimize data
         start_time = time.time()
-        original_data = load_data_file(file_path)
+        original_data = load_data_file(file_path, stat=file_stat)
         load_time = time.time() - start_time
         
         original_memory = original_data.memory_usage(deep=True).sum() / (1024 * 1024)
         
         # Apply optimizations
-        optimized_data = original_data.copy()
-        for col in optimized_data.select_dtypes(include=['object']).columns:
-            if optimized_data[col].nunique() / len(optimized_data) < 0.5:
-                optimized_data[col] = optimized_data[col].astype('category')
+        optimized_data = original_data.astype(dict.fromkeys(category_candidates(original_data), 'category'))
         
         optimized_memory = optimized_data.memory_usage(deep=True).sum() / (1024 * 1024)
         memory_reduction = ((original_memory - optimized_memory) / original_memory) * 100
@@ -3513,24 +4456,24 @@ async def handle_ml_readiness_assessment(args: Dict[str, Any]) -> Dict[str, Any]
     file_path = args.get("file_path", "")
     assessment_focus = args.get("assessment_focus", "comprehensive")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
         
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         print("🤖 MACHINE LEARNING READINESS ASSESSMENT:")
         print()
         
         # Calculate ML readiness score
-        numeric_cols = data.select_dtypes(include=[np.number]).columns
-        categorical_cols = data.select_dtypes(include=['object', 'category']).columns
+        summary = dataset_summary(file_path, stat=file_stat)
+        numeric_cols = summary.numeric_cols
+        categorical_cols = summary.object_cols + summary.category_cols
         
         # Data completeness score (25 points)
-        completeness = (1 - data.isnull().sum().sum() / (data.shape[0] * data.shape[1])) * 25
+        completeness = summary.completeness * 25
         
         # Feature diversity score (25 points)
         diversity_score = min((len(numeric_cols) + len(categorical_cols)) / 20 * 25, 25)
@@ -3538,9 +4481,9 @@ async def handle_ml_readiness_assessment(args: Dict[str, Any]) -> Dict[str, Any]
         # Dataset size score (25 points)
         size_score = min(len(data) / 10000 * 25, 25)
         
-        # Correlation structure score (25 points)
+        # Correlation structure score (25 points) - the off-diagonal |r| matrix is reused below
         if len(numeric_cols) > 1:
-            corr_matrix = data[numeric_cols].corr().abs()
+            corr_matrix = cached_correlation(file_path, file_stat, data[numeric_cols]).abs()
             np.fill_diagonal(corr_matrix.values, 0)
             avg_corr = corr_matrix.mean().mean()
             # Optimal correlation is moderate (0.3-0.7)
@@ -3608,8 +4551,6 @@ async def handle_ml_readiness_assessment(args: Dict[str, Any]) -> Dict[str, Any]
         
         # Correlation-based recommendations
         if len(numeric_cols) > 1:
-            corr_matrix = data[numeric_cols].corr().abs()
-            np.fill_diagonal(corr_matrix.values, 0)
             max_corr = corr_matrix.max().max()
             
             if max_corr > 0.8:
@@ -3658,22 +4599,22 @@ async def handle_executive_dashboard(args: Dict[str, Any]) -> Dict[str, Any]:
     file_path = args.get("file_path", "")
     dashboard_focus = args.get("dashboard_focus", "comprehensive")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
         
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         print("📊 EXECUTIVE PERFORMANCE DASHBOARD")
         print("=" * 45)
         print()
         
         # Performance KPIs
+        summary = dataset_summary(file_path, stat=file_stat)
         memory_usage = data.memory_usage(deep=True).sum() / (1024*1024)
-        numeric_cols = data.select_dtypes(include=[np.number]).columns
+        numeric_cols = summary.numeric_cols
         
         print("🎯 KEY PERFORMANCE INDICATORS:")
         print()
@@ -3694,13 +4635,13 @@ async def handle_executive_dashboard(args: Dict[str, Any]) -> Dict[str, Any]:
         print(f"   • Records Processed: {len(data):,} records")
         
         # Data quality calculation
-        data_quality = ((1 - data.isnull().sum().sum()/(data.shape[0]*data.shape[1])) * 100)
+        data_quality = summary.completeness * 100
         print(f"   • Data Quality: {data_quality:.1f}% complete")
         
         # Quick correlation analysis for dashboard
         strong_corr_count = 0
         if len(numeric_cols) > 1:
-            corr_matrix = data[numeric_cols].corr().abs()
+            corr_matrix = cached_correlation(file_path, file_stat, data[numeric_cols]).abs()
             np.fill_diagonal(corr_matrix.values, 0)
             strong_corr_count = (corr_matrix > 0.7).sum().sum() // 2
             print(f"   • Strong Correlations: {strong_corr_count} relationships identified")
@@ -3709,13 +4650,11 @@ async def handle_executive_dashboard(args: Dict[str, Any]) -> Dict[str, Any]:
         print("🤖 ML & ANALYTICS READINESS:")
         
         # Quick ML readiness calculation
-        completeness = (1 - data.isnull().sum().sum() / (data.shape[0] * data.shape[1])) * 25
-        diversity_score = min((len(numeric_cols) + len(data.select_dtypes(include=['object']).columns)) / 20 * 25, 25)
+        completeness = summary.completeness * 25
+        diversity_score = min((len(numeric_cols) + len(summary.object_cols)) / 20 * 25, 25)
         size_score = min(len(data) / 10000 * 25, 25)
         
         if len(numeric_cols) > 1:
-            corr_matrix = data[numeric_cols].corr().abs()
-            np.fill_diagonal(corr_matrix.values, 0)
             avg_corr = corr_matrix.mean().mean()
             if 0.3 <= avg_corr <= 0.7:
                 corr_score = 25
@@ -3810,16 +4749,13 @@ async def handle_create_distribution_plots(args: Dict[str, Any]) -> Dict[str, An
     plot_types = args.get("plot_types", ["histogram", "boxplot"])
     columns = args.get("columns", [])
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        import time
-        
         start_time = time.time()
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         # Get numeric columns
         numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
@@ -3910,16 +4846,13 @@ async def handle_create_correlation_heatmap(args: Dict[str, Any]) -> Dict[str, A
     cluster_variables = args.get("cluster_variables", False)
     show_significance = args.get("show_significance", False)
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        import time
-        
         start_time = time.time()
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
         
@@ -3928,14 +4861,14 @@ async def handle_create_correlation_heatmap(args: Dict[str, Any]) -> Dict[str, A
         
         # Calculate correlations
         if method == "both":
-            pearson_corr = data[numeric_cols].corr(method='pearson')
-            spearman_corr = data[numeric_cols].corr(method='spearman')
+            pearson_corr = cached_correlation(file_path, file_stat, data[numeric_cols], 'pearson')
+            spearman_corr = cached_correlation(file_path, file_stat, data[numeric_cols], 'spearman')
             correlations = {
                 "pearson": pearson_corr.to_dict(),
                 "spearman": spearman_corr.to_dict()
             }
         else:
-            corr_matrix = data[numeric_cols].corr(method=method)
+            corr_matrix = cached_correlation(file_path, file_stat, data[numeric_cols], method)
             correlations = {method: corr_matrix.to_dict()}
         
         # Find strong correlations
@@ -3947,16 +4880,14 @@ async def handle_create_correlation_heatmap(args: Dict[str, Any]) -> Dict[str, A
         else:
             main_corr = corr_matrix
         
-        for i in range(len(main_corr.columns)):
-            for j in range(i+1, len(main_corr.columns)):
-                corr_val = main_corr.iloc[i, j]
-                if abs(corr_val) > 0.5:
-                    strong_correlations.append({
-                        "var1": main_corr.columns[i],
-                        "var2": main_corr.columns[j],
-                        "correlation": round(float(corr_val), 3),
-                        "strength": "Strong" if abs(corr_val) > 0.7 else "Moderate"
-                    })
+        columns = main_corr.columns
+        for i, j, corr_val in zip(*(part.tolist() for part in strong_correlation_pairs(main_corr.to_numpy(), 0.5))):
+            strong_correlations.append({
+                "var1": columns[i],
+                "var2": columns[j],
+                "correlation": round(corr_val, 3),
+                "strength": "Strong" if abs(corr_val) > 0.7 else "Moderate"
+            })
         
         processing_time = time.time() - start_time
         
@@ -3998,27 +4929,20 @@ async def handle_create_time_series_plots(args: Dict[str, Any]) -> Dict[str, Any
     value_columns = args.get("value_columns", [])
     plot_types = args.get("plot_types", ["line", "trend"])
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        import time
-        
         start_time = time.time()
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         # Try to find date column if not specified
         if not date_column:
-            date_cols = []
-            for col in data.columns:
-                if any(keyword in col.lower() for keyword in ['date', 'time', 'timestamp']):
-                    try:
-                        pd.to_datetime(data[col].dropna().head(10))
-                        date_cols.append(col)
-                    except:
-                        continue
+            date_cols = [
+                col for col in data.columns
+                if any(keyword in col.lower() for keyword in ['date', 'time', 'timestamp']) and looks_like_dates(data[col])
+            ]
             
             if not date_cols:
                 return {"error": "No date/time column found or specified"}
@@ -4108,16 +5032,13 @@ async def handle_create_outlier_visualizations(args: Dict[str, Any]) -> Dict[str
     visualization_types = args.get("visualization_types", ["scatter", "boxplot"])
     columns = args.get("columns", [])
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        import time
-        
         start_time = time.time()
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
         if columns:
@@ -4148,10 +5069,11 @@ async def handle_create_outlier_visualizations(args: Dict[str, Any]) -> Dict[str
                 Q1 = series.quantile(0.25)
                 Q3 = series.quantile(0.75)
                 IQR = Q3 - Q1
-                iqr_outliers = series[(series < Q1 - 1.5 * IQR) | (series > Q3 + 1.5 * IQR)]
+                values = series.to_numpy()
+                n_iqr_outliers = int(((values < Q1 - 1.5 * IQR) | (values > Q3 + 1.5 * IQR)).sum())
                 outliers_detected["iqr"] = {
-                    "count": len(iqr_outliers),
-                    "percentage": round((len(iqr_outliers) / len(series)) * 100, 2),
+                    "count": n_iqr_outliers,
+                    "percentage": round((n_iqr_outliers / len(series)) * 100, 2),
                     "bounds": {
                         "lower": float(Q1 - 1.5 * IQR),
                         "upper": float(Q3 + 1.5 * IQR)
@@ -4245,16 +5167,13 @@ async def handle_create_business_intelligence_dashboard(args: Dict[str, Any]) ->
     include_kpis = args.get("include_kpis", True)
     dashboard_style = args.get("dashboard_style", "executive")
     
-    if not Path(file_path).exists():
+    file_stat = _require_file(file_path)
+    if file_stat is None:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        import pandas as pd
-        import numpy as np
-        import time
-        
         start_time = time.time()
-        data = load_data_file(file_path)
+        data = load_data_file(file_path, stat=file_stat)
         
         # Analyze dataset for BI insights
         numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
@@ -4366,6 +5285,37 @@ async def handle_create_business_intelligence_dashboard(args: Dict[str, Any]) ->
     except Exception as e:
         return {"error": f"Failed to create business intelligence dashboard: {str(e)}"}
 
+# Tool name -> handler, resolved with one dict lookup per call
+_HANDLERS = {
+    "discover_data": handle_discover_data,
+    "optimize_memory": handle_optimize_memory,
+    "dataset_overview": handle_dataset_overview,
+    "numeric_exploration": handle_numeric_exploration,
+    "skewness_analysis": handle_skewness_analysis,
+    "kurtosis_analysis": handle_kurtosis_analysis,
+    "distribution_shape_analysis": handle_distribution_shape_analysis,
+    "distribution_checks": handle_distribution_checks,
+    "correlation_analysis": handle_correlation_analysis,
+    "scatter_plots": handle_scatter_plots,
+    "temporal_analysis": handle_temporal_analysis,
+    "full_exploration_report": handle_full_exploration_report,
+    "optimized_analysis_workflow": handle_optimized_analysis_workflow,
+    "explain_methodology": handle_explain_methodology,
+    "start_guided_analysis": handle_start_guided_analysis,
+    "continue_analysis": handle_continue_analysis,
+    "export_optimized_dataset": handle_export_optimized_dataset,
+    "export_vectorized_dataset": handle_export_vectorized_dataset,
+    "advanced_feature_engineering": handle_advanced_feature_engineering,
+    "performance_benchmarking": handle_performance_benchmarking,
+    "ml_readiness_assessment": handle_ml_readiness_assessment,
+    "executive_dashboard": handle_executive_dashboard,
+    "create_distribution_plots": handle_create_distribution_plots,
+    "create_correlation_heatmap": handle_create_correlation_heatmap,
+    "create_time_series_plots": handle_create_time_series_plots,
+    "create_outlier_visualizations": handle_create_outlier_visualizations,
+    "create_business_intelligence_dashboard": handle_create_business_intelligence_dashboard,
+}
+
 async def main():
     """Main entry point for the MCP server."""
     logger.info("🚀 Starting Data Exploration MCP Server")
@@ -4379,5 +5329,12 @@ async def main():
         )
         await server.run(read_stream, write_stream, initialization_options)
 
+def run_server() -> None:
+    """Run the MCP server, on uvloop when it is available."""
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_server()
@@ -0,0 +1,91 @@
+"""
+Tests for the data file readers behind load_data_file.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("mcp")
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src import simple_mcp_server  # noqa: E402
+
+
+def test_chunked_csv_keeps_category_dtype_across_chunks(tmp_path):
+    # 'group' is low-cardinality text in the first chunk, empty in the second
+    # and boolean-looking in the third
+    path = tmp_path / "chunked.csv"
+    frame = pd.DataFrame({
+        "value": np.arange(300),
+        "group": ["a", "b"] * 50 + [None] * 100 + ["True", "False"] * 50,
+    })
+    frame.to_csv(path, index=False)
+
+    data = simple_mcp_server._read_csv_chunked(path, chunksize=100)
+
+    assert isinstance(data["group"].dtype, pd.CategoricalDtype)
+    assert set(data["group"].cat.categories) == {"a", "b", "True", "False"}
+    assert data["group"].isna().sum() == 100
+    assert data["value"].tolist() == list(range(300))
+
+
+def test_chunked_csv_matches_a_single_read(tmp_path):
+    path = tmp_path / "chunked.csv"
+    pd.DataFrame({
+        "x": np.linspace(0, 1, 250),
+        "label": ["low", "mid", "high", "mid", "low"] * 50,
+    }).to_csv(path, index=False)
+
+    chunked = simple_mcp_server._read_csv_chunked(path, chunksize=60)
+    whole = pd.read_csv(path)
+
+    assert chunked["x"].tolist() == whole["x"].tolist()
+    assert chunked["label"].astype(str).tolist() == whole["label"].astype(str).tolist()
+
+
+def test_json_lines_are_read_as_records(tmp_path):
+    path = tmp_path / "records.json"
+    path.write_text("\n".join(json.dumps({"a": i, "b": f"x{i}"}) for i in range(5)) + "\n")
+
+    data = simple_mcp_server._read_json(path)
+
+    assert data.shape == (5, 2)
+    assert data["a"].tolist() == list(range(5))
+
+
+def test_downcast_numeric_narrows_only_lossless_columns():
+    frame = pd.DataFrame({
+        "small_int": np.arange(10, dtype=np.int64),
+        "wide_int": np.arange(10, dtype=np.int64) * 10**10,
+        "coarse_float": np.linspace(0, 1, 10),
+        "fine_float": np.linspace(0, 1, 10) + 1e8,
+    })
+
+    dtypes = simple_mcp_server.downcast_numeric(frame).dtypes
+
+    assert dtypes["small_int"] == np.int8
+    assert dtypes["wide_int"] == np.int64
+    assert dtypes["coarse_float"] == np.float32
+    assert dtypes["fine_float"] == np.float64
+
+
+def test_parquet_sidecar_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "source.csv"
+    frame = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    frame.to_csv(path, index=False)
+    stat = path.stat()
+
+    simple_mcp_server._write_sidecar(path, stat, frame)
+
+    assert simple_mcp_server._read_sidecar(path, stat, ["b"])["b"].tolist() == ["x", "y", "z"]
+    path.write_text("a,b\n4,w\n")
+    assert simple_mcp_server._read_sidecar(path, path.stat()) is None
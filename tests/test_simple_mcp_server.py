@@ -0,0 +1,93 @@
+"""
+Tests for the MCP server's tool dispatch and result encoding.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("mcp")
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src import simple_mcp_server  # noqa: E402
+
+TEST_DATASET = str(project_root / "test_dataset.csv")
+
+
+def call_tool(name, arguments):
+    """Call a tool through the MCP entry point and return the response text."""
+    contents = asyncio.run(simple_mcp_server.handle_call_tool(name, arguments))
+    return contents[0].text
+
+
+@pytest.mark.parametrize("tool", ["full_exploration_report", "optimized_analysis_workflow"])
+def test_cached_report_is_identical_on_repeat_call(tool):
+    first = call_tool(tool, {"file_path": TEST_DATASET})
+    second = call_tool(tool, {"file_path": TEST_DATASET})
+
+    assert json.loads(first).get("status") == "success"
+    assert second == first
+
+
+def test_every_listed_tool_has_a_handler():
+    # create_advanced_scatter_matrix is listed but has never had a handler;
+    # calling it reports an unknown tool
+    listed = {tool.name for tool in simple_mcp_server.TOOL_LIST}
+    assert set(simple_mcp_server._HANDLERS) == listed - {"create_advanced_scatter_matrix"}
+
+
+def test_pearson_matrix_keeps_precision_with_large_offsets():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=5000)
+    frame = pd.DataFrame({"a": x + 1e6, "b": 0.7 * x + rng.normal(scale=0.7, size=5000) + 1e6})
+
+    expected = frame.corr().to_numpy()
+    assert np.allclose(simple_mcp_server.pearson_matrix(frame).to_numpy(), expected, atol=1e-5)
+
+
+def test_concurrent_guided_analysis_steps_are_serialized():
+    async def run_session():
+        await simple_mcp_server.handle_call_tool("start_guided_analysis", {"file_path": TEST_DATASET})
+        return await asyncio.gather(*(
+            simple_mcp_server.handle_call_tool("continue_analysis", {}) for _ in range(3)
+        ))
+
+    responses = [json.loads(contents[0].text) for contents in asyncio.run(run_session())]
+
+    assert sorted(response["step_completed"]["number"] for response in responses) == [1, 2, 3]
+
+
+def test_concurrent_numeric_exploration_on_a_large_frame(tmp_path):
+    # Above NUMBA_MIN_CELLS, so the JIT kernels run when numba is installed
+    rng = np.random.default_rng(0)
+    path = tmp_path / "large.csv"
+    pd.DataFrame(rng.normal(size=(150_000, 8)), columns=[f"c{i}" for i in range(8)]).to_csv(path, index=False)
+
+    async def run_concurrently():
+        return await asyncio.gather(*(
+            simple_mcp_server.handle_call_tool("numeric_exploration", {"file_path": str(path)}) for _ in range(4)
+        ))
+
+    responses = [contents[0].text for contents in asyncio.run(run_concurrently())]
+
+    assert json.loads(responses[0]).get("status") == "success"
+    assert all(response == responses[0] for response in responses)
+
+
+def test_disk_cache_key_changes_with_the_code_version():
+    key = ("handle_full_exploration_report", "{}", "digest", 1, 2)
+    original = simple_mcp_server._CODE_VERSION
+    current = simple_mcp_server._disk_cache_path(key)
+    try:
+        simple_mcp_server._CODE_VERSION = "older-release"
+        assert simple_mcp_server._disk_cache_path(key) != current
+    finally:
+        simple_mcp_server._CODE_VERSION = original